@@ -25,6 +25,7 @@ def write_last_run(project_root: Path, success: bool, message: str = ""):
 def main():
     setup_logging()
 
+    engine = None
     try:
         engine = ContentEngine(config_path="config.yaml")
         result = engine.run_daily()
@@ -46,6 +47,9 @@ def main():
         print(f"FAILED: {e}", file=sys.stderr)
         write_last_run(PROJECT_ROOT, success=False, message=str(e))
         raise
+    finally:
+        if engine is not None:
+            engine.close()
 
 
 if __name__ == "__main__":
@@ -78,6 +78,81 @@ class DailyResult:
     draft: BlogDraft
 
 
+# Draft parsing patterns, compiled once at import
+_RE_FAQ_BLOCK = re.compile(r"(## (?:FAQ|Frequently Asked)[^\n]*\n)([\s\S]+?)(?=\n## |\Z)", re.IGNORECASE)
+_RE_BOLD_QUESTION = re.compile(r"^\*\*(.+?)\*\*\s*$", re.MULTILINE)
+_RE_TITLE = re.compile(r"^#\s+(.+)$|^##\s+(.+)$", re.MULTILINE)
+_RE_TLDR = re.compile(r"(?:TL;DR|TLDR).*?\n((?:[-*]\s+.+\n){1,6})", re.IGNORECASE)
+_RE_KEY_TAKEAWAY = re.compile(r"(?:KEY TAKEAWAY|Key Takeaway).*?\n(.+?)(?:\n\n|\n#)", re.DOTALL | re.IGNORECASE)
+_RE_TABLE = re.compile(r"(\|.+\|[\s\S]*?\|.+\|)")
+_RE_FAQ_SECTION = re.compile(r"(?:## FAQ|## Frequently Asked).*?\n([\s\S]+?)(?=\n## |\Z)", re.IGNORECASE)
+_RE_FAQ_PAIR = re.compile(
+    r"(?:\*\*|###?\s*)(?:Q:\s*)?(.+?)(?:\*\*|$)\s*\n\s*(?:A:\s*)?(.+?)(?=\n\s*(?:\*\*|###?\s*)|$)",
+    re.MULTILINE,
+)
+_RE_FAQ_NUMBERED = re.compile(r"\d+\.\s*\*\*(.+?)\*\*\s*\n\s*(.+?)(?=\n\d+\.|\n\n|\Z)", re.DOTALL)
+_RE_HOWTO_STEP = re.compile(
+    r"(?:Step\s+\d+|###\s+\d+)[.:]\s*(.+?)\n\s*(.+?)(?=\n(?:Step|###\s+\d)|\Z)",
+    re.DOTALL,
+)
+_RE_META_DESCRIPTION = re.compile(r"meta.?description.*?:\s*(.+)", re.IGNORECASE)
+
+
+def _count_statistics(text: str) -> int:
+    """Count numeric statistics in text."""
+    # Match percentages, dollar amounts, and large numbers
+    patterns = [
+        r"\d+%",               # Percentages
+        r"\$[\d,.]+[MBK]?",    # Dollar amounts
+        r"\d{1,3}(?:,\d{3})+", # Large numbers with commas
+        r"\d+x\b",             # Multipliers
+    ]
+    count = 0
+    for pattern in patterns:
+        count += len(re.findall(pattern, text))
+    return count
+
+
+def _inject_planned_links(content_html: str, planned_links: list[dict], site_url: str) -> str:
+    """Wrap the first body-text occurrence of each planned anchor in a link to its target."""
+    if not planned_links:
+        return content_html
+
+    soup = BeautifulSoup(content_html, "html.parser")
+    injected = 0
+
+    for link in planned_links:
+        anchor_text = link["anchor"]
+        target = link["target"]
+
+        # Build full URL if relative path
+        if target.startswith("/"):
+            full_url = f"{site_url}{target}"
+        else:
+            full_url = target
+
+        # Find anchor text in content and wrap in link
+        pattern = re.compile(re.escape(anchor_text), re.IGNORECASE)
+        for text_node in soup.find_all(string=pattern):
+            parent = text_node.parent
+            if parent.name in ("a", "h1", "h2", "h3", "h4", "script"):
+                continue
+
+            new_html = pattern.sub(
+                f'<a href="{full_url}">{anchor_text}</a>',
+                str(text_node),
+                count=1,
+            )
+            if new_html != str(text_node):
+                text_node.replace_with(BeautifulSoup(new_html, "html.parser"))
+                injected += 1
+                break  # One link per anchor
+
+    if injected:
+        log.info(f"Injected {injected} planned internal links from frontmatter")
+    return str(soup)
+
+
 class ContentEngine:
     """The main orchestrator. Selects topics, generates drafts, builds schema, publishes."""
 
@@ -145,6 +220,9 @@ class ContentEngine:
         self._image_pipeline = None
         self._anthropic_client = None
 
+        # Notification transport — callable(subject, body); override to redirect
+        self.email_sender = self._send_email
+
         log.info("ContentEngine initialized")
 
     def _load_config(self, path: str) -> dict:
@@ -159,6 +237,15 @@ class ContentEngine:
             self._wp = WordPressPublisher()
         return self._wp
 
+    def close(self):
+        """Close the WordPress publisher's and image pipeline's sessions if opened."""
+        if self._wp is not None:
+            self._wp.close()
+            self._wp = None
+        if self._image_pipeline is not None:
+            self._image_pipeline.close()
+            self._image_pipeline = None
+
     @property
     def schema_builder(self) -> SchemaBuilder:
         if self._schema_builder is None:
@@ -444,10 +531,7 @@ Follow the V2 LLM-Optimized Template exactly. Every required element must be pre
         Only within the FAQ section to avoid touching other bold text.
         """
         # Find the FAQ section
-        faq_match = re.search(
-            r"(## (?:FAQ|Frequently Asked)[^\n]*\n)([\s\S]+?)(?=\n## |\Z)",
-            raw, re.IGNORECASE,
-        )
+        faq_match = _RE_FAQ_BLOCK.search(raw)
         if not faq_match:
             return raw
 
@@ -455,12 +539,7 @@ Follow the V2 LLM-Optimized Template exactly. Every required element must be pre
         faq_body = faq_match.group(2)
 
         # Convert **Question text?** at start of line to ### Question text?
-        fixed_body = re.sub(
-            r"^\*\*(.+?)\*\*\s*$",
-            r"### \1",
-            faq_body,
-            flags=re.MULTILINE,
-        )
+        fixed_body = _RE_BOLD_QUESTION.sub(r"### \1", faq_body)
 
         if fixed_body != faq_body:
             conversions = fixed_body.count("### ") - faq_body.count("### ")
@@ -524,11 +603,11 @@ Follow the V2 LLM-Optimized Template exactly. Every required element must be pre
         content_html = self._add_semantic_css_classes(content_html)
 
         # Extract title (first H1 or H2)
-        title_match = re.search(r"^#\s+(.+)$|^##\s+(.+)$", raw, re.MULTILINE)
+        title_match = _RE_TITLE.search(raw)
         title = (title_match.group(1) or title_match.group(2)) if title_match else topic.topic
 
         # Extract TL;DR bullets
-        tldr_section = re.search(r"(?:TL;DR|TLDR).*?\n((?:[-*]\s+.+\n){1,6})", raw, re.IGNORECASE)
+        tldr_section = _RE_TLDR.search(raw)
         tldr_bullets = []
         if tldr_section:
             tldr_bullets = [
@@ -538,14 +617,14 @@ Follow the V2 LLM-Optimized Template exactly. Every required element must be pre
             ]
 
         # Extract Key Takeaway
-        key_match = re.search(r"(?:KEY TAKEAWAY|Key Takeaway).*?\n(.+?)(?:\n\n|\n#)", raw, re.DOTALL | re.IGNORECASE)
+        key_match = _RE_KEY_TAKEAWAY.search(raw)
         key_takeaway = key_match.group(1).strip() if key_match else ""
 
         # Extract FAQ items
         faq_items = self._extract_faqs(raw)
 
         # Extract comparison table
-        table_match = re.search(r"(\|.+\|[\s\S]*?\|.+\|)", raw)
+        table_match = _RE_TABLE.search(raw)
         comparison_table = table_match.group(1) if table_match else ""
 
         # Word count
@@ -579,26 +658,20 @@ Follow the V2 LLM-Optimized Template exactly. Every required element must be pre
 
     def _extract_faqs(self, text: str) -> list[dict]:
         """Extract FAQ question-answer pairs from markdown."""
-        faq_section = re.search(r"(?:## FAQ|## Frequently Asked).*?\n([\s\S]+?)(?=\n## |\Z)", text, re.IGNORECASE)
+        faq_section = _RE_FAQ_SECTION.search(text)
         if not faq_section:
             return []
 
         items = []
         faq_text = faq_section.group(1)
         # Pattern: **Q: ...** or ### Q: ... followed by answer
-        q_pattern = re.findall(
-            r"(?:\*\*|###?\s*)(?:Q:\s*)?(.+?)(?:\*\*|$)\s*\n\s*(?:A:\s*)?(.+?)(?=\n\s*(?:\*\*|###?\s*)|$)",
-            faq_text, re.MULTILINE,
-        )
+        q_pattern = _RE_FAQ_PAIR.findall(faq_text)
         for q, a in q_pattern:
             items.append({"question": q.strip(), "answer": a.strip()})
 
         # Fallback: numbered list pattern
         if not items:
-            numbered = re.findall(
-                r"\d+\.\s*\*\*(.+?)\*\*\s*\n\s*(.+?)(?=\n\d+\.|\n\n|\Z)",
-                faq_text, re.DOTALL,
-            )
+            numbered = _RE_FAQ_NUMBERED.findall(faq_text)
             for q, a in numbered:
                 items.append({"question": q.strip(), "answer": a.strip()})
 
@@ -607,10 +680,7 @@ Follow the V2 LLM-Optimized Template exactly. Every required element must be pre
     def _extract_howto_steps(self, text: str) -> list[dict]:
         """Extract step-by-step instructions from markdown."""
         steps = []
-        step_pattern = re.findall(
-            r"(?:Step\s+\d+|###\s+\d+)[.:]\s*(.+?)\n\s*(.+?)(?=\n(?:Step|###\s+\d)|\Z)",
-            text, re.DOTALL,
-        )
+        step_pattern = _RE_HOWTO_STEP.findall(text)
         for title, desc in step_pattern:
             steps.append({"title": title.strip(), "description": desc.strip()})
         return steps
@@ -618,7 +688,7 @@ Follow the V2 LLM-Optimized Template exactly. Every required element must be pre
     def _extract_meta_description(self, text: str, topic: TopicSelection) -> str:
         """Generate a 150-160 char meta description."""
         # Try to find an explicit meta description
-        meta_match = re.search(r"meta.?description.*?:\s*(.+)", text, re.IGNORECASE)
+        meta_match = _RE_META_DESCRIPTION.search(text)
         if meta_match:
             desc = meta_match.group(1).strip()
             if 140 <= len(desc) <= 170:
@@ -768,7 +838,7 @@ Run a quick diagnostic on your {topic.smartscaling_function.lower() if topic.sma
             warnings.append(f"{draft.word_count} words (target max 2000)")
 
         # Stat density
-        stat_count = self._count_statistics(md)
+        stat_count = _count_statistics(md)
         expected_stats = draft.word_count // 175
         if stat_count < expected_stats:
             failures.append(f"Only {stat_count} stats found (expected ~{expected_stats})")
@@ -881,20 +951,6 @@ Run a quick diagnostic on your {topic.smartscaling_function.lower() if topic.sma
             warnings=warnings,
         )
 
-    def _count_statistics(self, text: str) -> int:
-        """Count numeric statistics in text."""
-        # Match percentages, dollar amounts, and large numbers
-        patterns = [
-            r"\d+%",               # Percentages
-            r"\$[\d,.]+[MBK]?",    # Dollar amounts
-            r"\d{1,3}(?:,\d{3})+", # Large numbers with commas
-            r"\d+x\b",             # Multipliers
-        ]
-        count = 0
-        for pattern in patterns:
-            count += len(re.findall(pattern, text))
-        return count
-
     def generate_reddit_angle(self, draft: BlogDraft, subreddit: str) -> str:
         """Condense blog into Reddit-appropriate format."""
         tldr = "\n".join(f"- {b}" for b in draft.tldr_bullets)
@@ -1059,43 +1115,8 @@ What's your experience with this? Has your company tried a systematic approach o
         Returns (modified_html, set_of_linked_urls) so reactive linking can
         avoid duplicates.
         """
-        if not planned_links:
-            return content_html
-
         site_url = self.config.get("site", {}).get("url", "https://revheat.com")
-        soup = BeautifulSoup(content_html, "html.parser")
-        injected = 0
-
-        for link in planned_links:
-            anchor_text = link["anchor"]
-            target = link["target"]
-
-            # Build full URL if relative path
-            if target.startswith("/"):
-                full_url = f"{site_url}{target}"
-            else:
-                full_url = target
-
-            # Find anchor text in content and wrap in link
-            pattern = re.compile(re.escape(anchor_text), re.IGNORECASE)
-            for text_node in soup.find_all(string=pattern):
-                parent = text_node.parent
-                if parent.name in ("a", "h1", "h2", "h3", "h4", "script"):
-                    continue
-
-                new_html = pattern.sub(
-                    f'<a href="{full_url}">{anchor_text}</a>',
-                    str(text_node),
-                    count=1,
-                )
-                if new_html != str(text_node):
-                    text_node.replace_with(BeautifulSoup(new_html, "html.parser"))
-                    injected += 1
-                    break  # One link per anchor
-
-        if injected:
-            log.info(f"Injected {injected} planned internal links from frontmatter")
-        return str(soup)
+        return _inject_planned_links(content_html, planned_links, site_url)
 
     def _extract_link_keywords(self, title: str) -> list[str]:
         """Extract linkable keyword phrases from a post title."""
@@ -1144,7 +1165,7 @@ Estimated review time: 25-30 minutes
 — RevHeat Blog Engine
 """
 
-        self._send_email(subject, body)
+        self.email_sender(subject, body)
 
     def _send_email(self, subject: str, body: str):
         """Send email or save to file as fallback."""
@@ -1246,10 +1267,7 @@ Estimated review time: 25-30 minutes
         content_with_links = self.build_internal_links(content_with_planned, self.wp.get_all_posts())
 
         # 8. Upload images to WordPress
-        media_ids = []
-        for img in images:
-            media_id = self.wp.upload_image(img.path, img.alt_text)
-            media_ids.append(media_id)
+        media_ids = self.wp.upload_images([(img.path, img.alt_text) for img in images])
 
         # 9. Create WordPress draft (with slug for duplicate protection)
         post = self.wp.create_draft(
@@ -1263,25 +1281,10 @@ Estimated review time: 25-30 minutes
             },
         )
 
-        # 10. Set featured image
-        if media_ids:
-            self.wp.set_featured_image(post["id"], media_ids[0])
-
-        # 11. Assign categories and tags
+        # 10. Resolve categories, tags and the featured image URL
         category_ids = [self.wp.get_category_id(s) for s in draft.categories]
         tag_ids = [self.wp.get_tag_id(s) for s in draft.tags]
-        self.wp.assign_taxonomy(post["id"], category_ids, tag_ids)
 
-        # 11b. Set SEO meta (with secondary keywords + robots)
-        self.wp.set_seo_meta(
-            post["id"],
-            seo_title=draft.seo_title,
-            meta_desc=draft.meta_description,
-            focus_keyword=topic.primary_keyword,
-            secondary_keywords=topic.secondary_keywords,
-        )
-
-        # 11c. Set OpenGraph + Twitter Card + Canonical
         post_url = f"https://revheat.com/{draft.slug}/"
         featured_url = ""
         if images:
@@ -1292,13 +1295,26 @@ Estimated review time: 25-30 minutes
             except Exception:
                 pass
 
-        self.wp.set_social_meta(
+        # 11. Featured image, taxonomy, SEO meta (with secondary keywords + robots),
+        #     OpenGraph + Twitter Card and canonical in one post update
+        self.wp.batch_update(
             post["id"],
-            title=draft.seo_title or draft.title,
-            description=draft.meta_description,
-            image_url=featured_url,
+            featured_media=media_ids[0] if media_ids else None,
+            categories=category_ids,
+            tags=tag_ids,
+            seo={
+                "seo_title": draft.seo_title,
+                "meta_desc": draft.meta_description,
+                "focus_keyword": topic.primary_keyword,
+                "secondary_keywords": topic.secondary_keywords,
+            },
+            social={
+                "title": draft.seo_title or draft.title,
+                "description": draft.meta_description,
+                "image_url": featured_url,
+            },
+            canonical_url=post_url,
         )
-        self.wp.set_canonical_url(post["id"], post_url)
 
         # 12. Generate Reddit angle
         reddit_draft = self.generate_reddit_angle(draft, topic.target_subreddit)
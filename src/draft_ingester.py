@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -11,9 +12,87 @@ import yaml
 from slugify import slugify
 
 from src.content_engine import BlogDraft, TopicSelection
+from src.utils.serialization import YamlLoader
 
 log = logging.getLogger(__name__)
 
+# Frontmatter fast path: flat `key: value` lines only
+_FM_LINE_RE = re.compile(r"([A-Za-z_][\w-]*):[ \t]+(\S.*?)[ \t]*")
+_YAML_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+
+
+def _plain_yaml_string(value: str) -> str | None:
+    """Return value as YAML would load it if it is certainly a plain string, else None."""
+    first = value[0]
+    if first in "'\"":
+        inner = value[1:-1]
+        if len(value) >= 2 and value[-1] == first and first not in inner and "\\" not in inner:
+            return inner
+        return None
+    if first in _YAML_INDICATORS or ": " in value or " #" in value or "\t" in value or value.endswith(":"):
+        return None
+    # Anything YAML would resolve to a bool, number, null, date, etc. needs the real loader
+    resolvers = YamlLoader.yaml_implicit_resolvers
+    for _tag, regexp in resolvers.get(first, []) + resolvers.get(None, []):
+        if regexp.match(value):
+            return None
+    return value
+
+
+def _parse_simple_frontmatter(yaml_text: str) -> dict | None:
+    """Parse frontmatter made only of `key: string` and `key: [a, b]` lines.
+
+    Returns None for anything else (nesting, block lists, comments, typed
+    scalars) so the caller falls back to the YAML loader.
+    """
+    metadata = {}
+    for line in yaml_text.splitlines():
+        if not line.strip():
+            continue
+        match = _FM_LINE_RE.fullmatch(line)
+        if not match:
+            return None
+        key, value = match.groups()
+        if _plain_yaml_string(key) is None:  # e.g. `yes:` loads as a bool key
+            return None
+
+        if value[0] == "[" and value[-1] == "]":
+            inner = value[1:-1].strip()
+            items = [item.strip() for item in inner.split(",")] if inner else []
+            parsed = [_plain_yaml_string(item) if item else None for item in items]
+            if any(item is None or any(c in item for c in "[]{}") for item in parsed):
+                return None
+            metadata[key] = parsed
+        else:
+            parsed = _plain_yaml_string(value)
+            if parsed is None:
+                return None
+            metadata[key] = parsed
+    return metadata
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_frozen_links(frozen_links: tuple) -> tuple[tuple[str, str, str], ...]:
+    """Classify (key, anchor, target) triples into (anchor, target, type) triples."""
+    normalized = []
+    for link_key, anchor, target in frozen_links:
+        if anchor and target:
+            # Classify by key name: pillar_link, sibling_link, cross_pillar, etc.
+            link_type = "internal"
+            key_lower = link_key.lower()
+            if "pillar" in key_lower and "cross" not in key_lower:
+                link_type = "pillar"
+            elif "cross" in key_lower:
+                link_type = "cross_pillar"
+            elif "sibling" in key_lower or "sister" in key_lower:
+                link_type = "sibling"
+            elif "cluster" in key_lower:
+                link_type = "cluster"
+            elif "post" in key_lower:
+                link_type = "post"
+            normalized.append((anchor.strip(), target.strip(), link_type))
+    return tuple(normalized)
+
 
 class DraftIngester:
     """Reads markdown files from the drafts folder, parses frontmatter and body,
@@ -45,6 +124,10 @@ class DraftIngester:
 
     def __init__(self, content_map: dict = None):
         self.content_map = content_map or {}
+        self._content_map_entries = self._flatten_content_map(self.content_map)
+        self._content_map_matches: dict[str, dict | None] = {}
+        # drafts_dir -> (folder mtime signature, sorted file list)
+        self._scan_cache: dict[str, tuple[tuple, list[Path]]] = {}
 
     def scan_drafts_folder(self, drafts_dir: str) -> list[Path]:
         """Find all markdown files in the drafts directory, sorted by publish priority."""
@@ -53,17 +136,54 @@ class DraftIngester:
             log.warning(f"Drafts directory not found: {drafts_dir}")
             return []
 
-        all_files = sorted(drafts_path.rglob("*.md"))
+        # Adding, removing or renaming a draft bumps its folder's mtime
+        sig = self._scan_signature(drafts_path)
+        cached = self._scan_cache.get(drafts_dir)
+        if cached and cached[0] == sig:
+            return list(cached[1])
+
+        # Bucket by folder priority in one pass (os.walk is scandir-backed, so
+        # file/dir checks reuse the readdir results), then order by filename
+        # within each bucket; full path breaks filename ties
+        buckets: dict[int, list[tuple[str, Path]]] = {}
+        for dirpath, _dirnames, filenames in os.walk(drafts_path):
+            priority = self.FOLDER_PRIORITY.get(os.path.basename(dirpath), 99)
+            bucket = buckets.setdefault(priority, [])
+            for name in filenames:
+                if name.endswith(".md"):
+                    bucket.append((name, Path(dirpath, name)))
+
+        all_files = [
+            filepath
+            for priority in sorted(buckets)
+            for _name, filepath in sorted(buckets[priority])
+        ]
+        log.info(f"Found {len(all_files)} draft files in {drafts_dir}")
+        self._scan_cache[drafts_dir] = (sig, all_files)
+        return list(all_files)
 
-        # Sort by folder priority, then filename
-        def sort_key(filepath: Path):
-            parent = filepath.parent.name
-            folder_priority = self.FOLDER_PRIORITY.get(parent, 99)
-            return (folder_priority, filepath.name)
+    @staticmethod
+    def _scan_signature(drafts_path: Path) -> tuple:
+        """(relative path, mtime) of every directory in the drafts tree.
 
-        all_files.sort(key=sort_key)
-        log.info(f"Found {len(all_files)} draft files in {drafts_dir}")
-        return all_files
+        Adding or removing a file only bumps its own directory's mtime, so
+        every level the scan walks has to be part of the signature.
+        """
+        sig = []
+        stack = [(drafts_path, "")]
+        while stack:
+            path, rel = stack.pop()
+            sig.append((rel, path.stat().st_mtime_ns))
+            with os.scandir(path) as it:
+                for entry in it:
+                    # Don't follow symlinks, matching os.walk in the scan itself
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), f"{rel}/{entry.name}"))
+        return tuple(sorted(sig))
+
+    def clear_scan_cache(self):
+        """Forget cached folder scans so the next call re-walks the drafts tree."""
+        self._scan_cache.clear()
 
     def parse_frontmatter(self, filepath: str | Path) -> tuple[dict, str]:
         """Parse YAML frontmatter and markdown body from a file.
@@ -75,12 +195,17 @@ class DraftIngester:
 
         # Check for YAML frontmatter (starts with ---)
         if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                yaml_text = parts[1].strip()
-                body = parts[2].strip()
+            # Slice around the closing marker rather than split(), so the
+            # body is copied once instead of twice
+            end = content.find("---", 3)
+            if end != -1:
+                yaml_text = content[3:end].strip()
+                body = content[end + 3:].strip()
+                metadata = _parse_simple_frontmatter(yaml_text)
+                if metadata is not None:
+                    return metadata, body
                 try:
-                    metadata = yaml.safe_load(yaml_text) or {}
+                    metadata = yaml.load(yaml_text, Loader=YamlLoader) or {}
                     return metadata, body
                 except yaml.YAMLError as e:
                     log.warning(f"Failed to parse frontmatter in {filepath}: {e}")
@@ -130,55 +255,74 @@ class DraftIngester:
         """Search the content map for a post matching the slug hint."""
         slug_hint_clean = slug_hint.lower().replace("_", "-")
 
+        # Results are memoized per cleaned hint; callers get their own copy
+        if slug_hint_clean not in self._content_map_matches:
+            self._content_map_matches[slug_hint_clean] = self._match_content_map(slug_hint_clean)
+        match = self._content_map_matches[slug_hint_clean]
+        return dict(match) if match is not None else None
+
+    def _match_content_map(self, slug_hint_clean: str) -> dict | None:
+        """Walk the flattened content map in priority order; first match wins."""
+        for kind, slug, entry in self._content_map_entries:
+            if kind == "pillar":
+                matched = slug in slug_hint_clean or slug_hint_clean in slug
+            elif kind == "post":
+                matched = slug == slug_hint_clean or slug_hint_clean in slug or slug in slug_hint_clean
+            else:  # cluster pages and cross-pillar posts match exactly
+                matched = slug == slug_hint_clean
+            if matched:
+                return entry
+        return None
+
+    @staticmethod
+    def _flatten_content_map(content_map: dict) -> list[tuple[str, str, dict]]:
+        """Flatten the content map into (kind, slug, entry) rows in lookup order."""
+        entries = []
+
         for pillar_name in ["strategy", "people", "process", "performance"]:
-            pillar_data = self.content_map.get(pillar_name, {})
+            pillar_data = content_map.get(pillar_name, {})
 
-            # Check pillar page
+            # Pillar page
             pillar_page = pillar_data.get("pillar_page", {})
             pillar_slug = pillar_page.get("slug", "").lower()
-            if pillar_slug and (pillar_slug in slug_hint_clean or slug_hint_clean in pillar_slug):
-                return {
+            if pillar_slug:
+                entries.append(("pillar", pillar_slug, {
                     "slug": pillar_page.get("slug"),
                     "keyword": pillar_page.get("target_keyword", ""),
                     "format": "pillar_page",
                     "_pillar": pillar_name,
                     "_function": "",
-                }
+                }))
 
-            # Check cluster pages and posts
+            # Cluster pages and their posts
             clusters = pillar_data.get("clusters", {})
             for cluster_name, cluster_data in clusters.items():
-                # Check cluster page
                 cluster_page = cluster_data.get("cluster_page", {})
                 cluster_slug = cluster_page.get("slug", "").lower()
-                if cluster_slug and cluster_slug == slug_hint_clean:
-                    return {
-                        "slug": cluster_page.get("slug", slug_hint_clean),
+                if cluster_slug:
+                    entries.append(("cluster", cluster_slug, {
+                        "slug": cluster_page.get("slug"),
                         "keyword": cluster_page.get("target_keyword", ""),
                         "format": "cluster_page",
                         "_pillar": pillar_name,
                         "_function": cluster_page.get("title", cluster_name),
-                    }
+                    }))
 
-                # Check posts
                 for post in cluster_data.get("posts", []):
-                    if isinstance(post, dict):
-                        post_slug = post.get("slug", "")
-                        # Match if slug matches or hint is contained
-                        if post_slug and (post_slug == slug_hint_clean or slug_hint_clean in post_slug or post_slug in slug_hint_clean):
-                            return {
-                                **post,
-                                "_pillar": pillar_name,
-                                "_function": cluster_page.get("title", cluster_name),
-                            }
-
-        # Check cross-pillar
-        cross = self.content_map.get("cross_pillar", {})
+                    if isinstance(post, dict) and post.get("slug", ""):
+                        entries.append(("post", post["slug"], {
+                            **post,
+                            "_pillar": pillar_name,
+                            "_function": cluster_page.get("title", cluster_name),
+                        }))
+
+        # Cross-pillar posts
+        cross = content_map.get("cross_pillar", {})
         for post in cross.get("posts", []):
-            if isinstance(post, dict) and post.get("slug") and post["slug"] == slug_hint_clean:
-                return {**post, "_pillar": "cross_pillar", "_function": ""}
+            if isinstance(post, dict) and post.get("slug"):
+                entries.append(("cross_pillar", post["slug"], {**post, "_pillar": "cross_pillar", "_function": ""}))
 
-        return None
+        return entries
 
     def build_topic_from_metadata(self, metadata: dict, body: str) -> TopicSelection:
         """Build a TopicSelection from frontmatter metadata."""
@@ -269,46 +413,34 @@ class DraftIngester:
     @staticmethod
     def _normalize_internal_links(raw_links: dict) -> list[dict]:
         """Convert frontmatter internal_links dict into a flat list of {anchor, target, type}."""
-        normalized = []
-        for link_key, link_data in raw_links.items():
-            if not isinstance(link_data, dict):
-                continue
-            anchor = link_data.get("anchor", "")
-            target = link_data.get("target", "")
-            if anchor and target:
-                # Classify by key name: pillar_link, sibling_link, cross_pillar, etc.
-                link_type = "internal"
-                key_lower = link_key.lower()
-                if "pillar" in key_lower and "cross" not in key_lower:
-                    link_type = "pillar"
-                elif "cross" in key_lower:
-                    link_type = "cross_pillar"
-                elif "sibling" in key_lower or "sister" in key_lower:
-                    link_type = "sibling"
-                elif "cluster" in key_lower:
-                    link_type = "cluster"
-                elif "post" in key_lower:
-                    link_type = "post"
-                normalized.append({
-                    "anchor": anchor.strip(),
-                    "target": target.strip(),
-                    "type": link_type,
-                })
-        return normalized
+        # Freeze to a hashable key so repeated frontmatter (sibling/cluster pages
+        # sharing the same link block) hits the cache instead of re-classifying.
+        frozen = tuple(
+            (link_key, link_data.get("anchor", ""), link_data.get("target", ""))
+            for link_key, link_data in raw_links.items()
+            if isinstance(link_data, dict)
+        )
+        return [
+            {"anchor": anchor, "target": target, "type": link_type}
+            for anchor, target, link_type in _normalize_frozen_links(frozen)
+        ]
 
     def get_ingestion_queue(self, drafts_dir: str, published_slugs: set[str]) -> list[Path]:
         """Get ordered list of draft files that haven't been published yet."""
+        published_slugs = frozenset(published_slugs)
         all_files = self.scan_drafts_folder(drafts_dir)
         queue = []
 
         for filepath in all_files:
-            metadata, body = self.parse_frontmatter(filepath)
-            if not metadata:
-                metadata = self.infer_metadata_from_content(body, filepath)
+            slug = self._peek_frontmatter_slug(filepath)
+            if slug is None:
+                metadata, body = self.parse_frontmatter(filepath)
+                if not metadata:
+                    metadata = self.infer_metadata_from_content(body, filepath)
 
-            slug = metadata.get("slug", "")
-            if not slug:
-                slug = slugify(filepath.stem, max_length=60)
+                slug = metadata.get("slug", "")
+                if not slug:
+                    slug = slugify(filepath.stem, max_length=60)
 
             if slug not in published_slugs:
                 queue.append(filepath)
@@ -317,3 +449,33 @@ class DraftIngester:
 
         log.info(f"Ingestion queue: {len(queue)} files remaining ({len(all_files) - len(queue)} already published)")
         return queue
+
+    @staticmethod
+    def _peek_frontmatter_slug(filepath: Path, head_size: int = 1024) -> str | None:
+        """Read the frontmatter slug from the file head, when that is conclusive.
+
+        Uses the same closing-marker rule and flat-line parser as
+        parse_frontmatter, so a slug returned here is exactly what the full
+        parse would produce. Returns None (caller does the full parse) when the
+        frontmatter doesn't close within head_size bytes, needs the YAML
+        loader, or has no string slug.
+        """
+        with open(filepath, "rb") as f:
+            head = f.read(head_size)
+        if not head.startswith(b"---"):
+            return None
+
+        end = head.find(b"---", 3)
+        if end == -1:
+            return None
+        try:
+            yaml_text = head[3:end].decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        # Match parse_frontmatter's text-mode read (universal newlines)
+        yaml_text = yaml_text.replace("\r\n", "\n").replace("\r", "\n").strip()
+        metadata = _parse_simple_frontmatter(yaml_text)
+        if not metadata:
+            return None
+        slug = metadata.get("slug")
+        return slug if isinstance(slug, str) and slug else None
@@ -1,8 +1,13 @@
 """Image Pipeline — generates branded data visualizations, quote cards, and framework diagrams."""
 
+import copy
+import functools
 import io
 import logging
 import os
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -10,11 +15,29 @@ import requests
 import yaml
 from dotenv import load_dotenv
 from PIL import Image, ImageDraw, ImageFont
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.serialization import YamlLoader
 
 load_dotenv(override=True)
 
 log = logging.getLogger(__name__)
 
+# Parsed brand configs keyed by (absolute path, mtime_ns); never handed out directly,
+# each pipeline gets its own deep copy
+_BRAND_CACHE: dict[tuple[str, int], dict] = {}
+
+# matplotlib's rcParams are process-global, so the lazy setup runs under one lock
+# even when charts are generated from pool threads
+_MPL_SETUP_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_hex_color(hex_color: str) -> tuple:
+    hex_color = hex_color.lstrip("#")
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
 
 @dataclass
 class ImageResult:
@@ -29,6 +52,9 @@ class ImageResult:
 class ImagePipeline:
     """Generates branded data visualizations for RevHeat blog posts."""
 
+    # Chart types drawn directly with Pillow; everything else goes through matplotlib
+    PIL_CHART_TYPES = frozenset({"bar", "comparison_bar"})
+
     def __init__(self, brand_config_path="assets/brand/colors.yaml"):
         self.brand = self._load_brand_config(brand_config_path)
         self.output_dir = "output/images"
@@ -37,14 +63,28 @@ class ImagePipeline:
         # ShortPixel API
         self.shortpixel_key = os.getenv("SHORTPIXEL_API_KEY", "")
 
-        # Try to set up matplotlib with brand styling
-        self._setup_matplotlib()
+        # Pooled HTTP session — keeps TLS connections alive across images
+        self._http = self._init_http_session()
+
+        # Loaded fonts keyed by (size, bold), one cache per thread since FreeType
+        # faces aren't safe to share across threads; the resolved font path per
+        # weight is shared
+        self._fonts = threading.local()
+        self._font_paths: dict[bool, str | None] = {}
+
+        # matplotlib is imported and styled on first non-bar chart
+        self._mpl_available = None
         log.info("ImagePipeline initialized")
 
     def _load_brand_config(self, path: str) -> dict:
         if os.path.exists(path):
-            with open(path) as f:
-                return yaml.safe_load(f)
+            key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+            brand = _BRAND_CACHE.get(key)
+            if brand is None:
+                with open(path) as f:
+                    brand = yaml.load(f, Loader=YamlLoader)
+                _BRAND_CACHE[key] = brand
+            return copy.deepcopy(brand)
         # Defaults — match revheat.com brand
         return {
             "colors": {
@@ -69,6 +109,22 @@ class ImagePipeline:
             },
         }
 
+    @staticmethod
+    def _init_http_session() -> requests.Session:
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+        )
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        return session
+
+    def close(self):
+        """Close the pooled HTTP session and its keep-alive connections."""
+        self._http.close()
+
     def _setup_matplotlib(self):
         """Configure matplotlib with brand styling."""
         try:
@@ -98,11 +154,43 @@ class ImagePipeline:
             log.warning("matplotlib not available, chart generation disabled")
 
     def _hex_to_rgb(self, hex_color: str) -> tuple:
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return _parse_hex_color(hex_color)
 
     def _get_font(self, size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
-        """Try to load a TTF font, searching platform-specific paths."""
+        """Return this thread's cached font for (size, bold), loading it on first use."""
+        cache = getattr(self._fonts, "cache", None)
+        if cache is None:
+            cache = self._fonts.cache = {}
+        key = (size, bold)
+        font = cache.get(key)
+        if font is None:
+            font = cache[key] = self._load_font(size, bold)
+        return font
+
+    def _load_font(self, size: int, bold: bool) -> ImageFont.FreeTypeFont:
+        """Try to load a TTF font, searching platform-specific paths.
+
+        The first path that loads is remembered per weight, so later sizes
+        skip the directory search.
+        """
+        if bold in self._font_paths:
+            path = self._font_paths[bold]
+            return ImageFont.truetype(path, size) if path else ImageFont.load_default()
+
+        for path in self._font_candidates(bold):
+            try:
+                font = ImageFont.truetype(path, size)
+            except (OSError, IOError):
+                continue
+            self._font_paths[bold] = path
+            return font
+
+        log.warning(f"No TrueType font found, using Pillow default (size={size}, bold={bold})")
+        self._font_paths[bold] = None
+        return ImageFont.load_default()
+
+    def _font_candidates(self, bold: bool) -> list[str]:
+        """Font paths to try, in order of preference."""
         import platform
 
         if bold:
@@ -133,35 +221,24 @@ class ImagePipeline:
                 "/usr/share/fonts",
             ])
 
-        for font_dir in font_dirs:
-            for name in font_names:
-                path = os.path.join(font_dir, name)
-                try:
-                    return ImageFont.truetype(path, size)
-                except (OSError, IOError):
-                    continue
-
-        # Try font names directly (relies on system font config / fontconfig)
-        for name in font_names:
-            try:
-                return ImageFont.truetype(name, size)
-            except (OSError, IOError):
-                continue
-
-        # Last resort — macOS Helvetica or Pillow default
-        for fallback in ["/System/Library/Fonts/Helvetica.ttc", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"]:
-            try:
-                return ImageFont.truetype(fallback, size)
-            except (OSError, IOError):
-                continue
-
-        log.warning(f"No TrueType font found, using Pillow default (size={size}, bold={bold})")
-        return ImageFont.load_default()
+        candidates = [os.path.join(font_dir, name) for font_dir in font_dirs for name in font_names]
+        # Font names directly (relies on system font config / fontconfig)
+        candidates.extend(font_names)
+        # Last resort — macOS Helvetica
+        candidates.extend(["/System/Library/Fonts/Helvetica.ttc", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"])
+        return candidates
 
     def generate_data_chart(self, data: dict, chart_type: str, title: str, subtitle: str = "") -> ImageResult:
-        """Generate a branded data chart using matplotlib."""
+        """Generate a branded data chart (Pillow for simple bars, matplotlib otherwise)."""
+        if chart_type in self.PIL_CHART_TYPES:
+            return self._render_bar_pil(data, title, subtitle)
+
+        if self._mpl_available is None:
+            with _MPL_SETUP_LOCK:
+                if self._mpl_available is None:
+                    self._setup_matplotlib()
         if not self._mpl_available:
-            return self._generate_chart_fallback(data, chart_type, title, subtitle)
+            return self._render_bar_pil(data, title, subtitle)
 
         import matplotlib.pyplot as plt
 
@@ -182,22 +259,7 @@ class ImagePipeline:
         if highlight_idx is not None and 0 <= highlight_idx < len(bar_colors):
             bar_colors[highlight_idx] = colors.get("primary", "#E63946")
 
-        if chart_type in ("bar", "comparison_bar"):
-            bars = ax.barh(labels, values, color=bar_colors, edgecolor="white", linewidth=0.5)
-            for bar, val in zip(bars, values):
-                ax.text(
-                    bar.get_width() + max(values) * 0.02,
-                    bar.get_y() + bar.get_height() / 2,
-                    f"{val}{unit}",
-                    va="center",
-                    fontsize=10,
-                    fontweight="bold",
-                    color=colors.get("text_dark", "#1D3557"),
-                )
-            ax.set_xlabel("")
-            ax.invert_yaxis()
-
-        elif chart_type == "line":
+        if chart_type == "line":
             ax.plot(labels, values, color=colors.get("primary", "#E63946"), linewidth=2, marker="o", markersize=8)
             for i, (x, y) in enumerate(zip(labels, values)):
                 ax.annotate(f"{y}{unit}", (x, y), textcoords="offset points", xytext=(0, 10), ha="center", fontsize=9)
@@ -263,8 +325,8 @@ class ImagePipeline:
             format="png",
         )
 
-    def _generate_chart_fallback(self, data, chart_type, title, subtitle) -> ImageResult:
-        """Generate a simple chart using Pillow when matplotlib is unavailable."""
+    def _render_bar_pil(self, data, title, subtitle) -> ImageResult:
+        """Draw a horizontal bar chart with Pillow (also the fallback when matplotlib is unavailable)."""
         dims = self.brand["dimensions"]["chart"]
         colors = self.brand["colors"]
         w, h = dims["width"] * 2, dims["height"] * 2  # Retina
@@ -287,6 +349,7 @@ class ImagePipeline:
         labels = data.get("labels", [])
         values = data.get("values", [])
         unit = data.get("unit", "")
+        highlight_idx = data.get("highlight_index")
         if labels and values:
             max_val = max(values) if values else 1
             bar_area_top = 160
@@ -298,7 +361,7 @@ class ImagePipeline:
             for i, (label, val) in enumerate(zip(labels, values)):
                 y = bar_area_top + i * (bar_height + bar_spacing)
                 bar_w = int((val / max_val) * max_bar_width) if max_val > 0 else 0
-                c = self._hex_to_rgb(chart_colors_hex[i % len(chart_colors_hex)])
+                c = primary if i == highlight_idx else self._hex_to_rgb(chart_colors_hex[i % len(chart_colors_hex)])
 
                 draw.text((20, y + bar_height // 2), label, fill=text_color, font=font_body, anchor="lm")
                 draw.rectangle([300, y, 300 + bar_w, y + bar_height], fill=c)
@@ -320,7 +383,14 @@ class ImagePipeline:
             "source": "RevHeat Research — 33,000+ companies",
         })
 
-        return ImageResult(path=filepath, alt_text=alt_text, caption=title, width=img.width, height=img.height, format="png")
+        return ImageResult(
+            path=filepath,
+            alt_text=alt_text,
+            caption=f"{title}. {subtitle}" if subtitle else title,
+            width=img.width,
+            height=img.height,
+            format="png",
+        )
 
     def generate_quote_card(self, quote_text: str, author: str = "Ken Lundin") -> ImageResult:
         """Generate a branded quote card image."""
@@ -694,20 +764,40 @@ class ImagePipeline:
 
         return self._compress_pillow(image_path)
 
+    def compress_images(self, image_paths: list[str], max_workers: int = 4) -> list[str]:
+        """Compress several images concurrently, returning output paths in input order.
+
+        An image that fails to compress keeps its original path.
+        """
+        def compress_one(image_path: str) -> str:
+            try:
+                return self.compress_image(image_path)
+            except Exception as e:
+                log.warning(f"Compression failed for {image_path}: {e}")
+                return image_path
+
+        if not image_paths:
+            return []
+        # Uploads share the pooled session; Pillow's WebP encoder releases the GIL
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(image_paths))) as pool:
+            return list(pool.map(compress_one, image_paths))
+
     def _compress_shortpixel(self, image_path: str) -> str:
         """Compress via ShortPixel API."""
+        # Read into memory so a retried POST re-sends the full upload
         with open(image_path, "rb") as f:
-            resp = requests.post(
-                "https://api.shortpixel.com/v2/reducer.php",
-                files={"file": f},
-                data={
-                    "key": self.shortpixel_key,
-                    "lossy": 1,
-                    "convertto": "+webp",
-                    "resize": 0,
-                },
-                timeout=60,
-            )
+            file_bytes = f.read()
+        resp = self._http.post(
+            "https://api.shortpixel.com/v2/reducer.php",
+            files={"file": (os.path.basename(image_path), file_bytes)},
+            data={
+                "key": self.shortpixel_key,
+                "lossy": 1,
+                "convertto": "+webp",
+                "resize": 0,
+            },
+            timeout=(3.05, 60),
+        )
 
         if resp.status_code != 200:
             raise Exception(f"ShortPixel API HTTP error: {resp.status_code}")
@@ -742,11 +832,22 @@ class ImagePipeline:
         log.info(f"ShortPixel: {original_size} -> {new_size} ({100 - new_size*100//original_size}% reduction)")
         return output_path
 
-    def _compress_pillow(self, image_path: str) -> str:
-        """Compress using Pillow as fallback."""
-        img = Image.open(image_path)
+    def _compress_pillow(self, image_path: str, max_size: tuple[int, int] = (2400, 2400)) -> str:
+        """Compress using Pillow as fallback.
+
+        Images at least twice max_size on both sides are first shrunk by an
+        integer factor with reduce() (a fast box filter) before encoding.
+        """
         output_path = image_path.rsplit(".", 1)[0] + ".webp"
-        img.save(output_path, "WEBP", quality=85, method=6)
+        with Image.open(image_path) as img:
+            factor = max(1, min(img.width // max_size[0], img.height // max_size[1]))
+            if factor > 1:
+                # reduce() rejects palette/bilevel/16-bit modes (GIF, some TIFFs)
+                if img.mode in ("P", "1", "I;16"):
+                    img = img.convert("RGBA")
+                img = img.reduce(factor)
+            # method=4 encodes markedly faster than 6 for a few percent in size
+            img.save(output_path, "WEBP", quality=85, method=4)
         log.info(f"Pillow compression: {image_path} -> {output_path}")
         return output_path
 
@@ -761,10 +862,12 @@ class ImagePipeline:
             alt += f": {summary}"
         alt += f". {source}."
 
-        # Truncate to 125 chars
-        if len(alt) > 125:
-            alt = alt[:122] + "..."
-        return alt
+        # Truncate to 125 chars on a word boundary; a first word too long to fit
+        # leaves only the placeholder, so hard-cut that case instead
+        short = textwrap.shorten(alt, width=125, placeholder="...")
+        if short == "...":
+            return alt[:122] + "..."
+        return short
 
     def extract_chart_data_from_draft(self, draft) -> dict:
         """Extract real data points from the draft's markdown comparison table."""
@@ -875,51 +978,56 @@ class ImagePipeline:
         It must be a clean branded image, NOT a data chart.  Data charts and
         comparison graphics are in-content images only.
         """
-        results = []
+        # Collect (generator, kwargs) jobs in results order; they render concurrently
+        jobs = []
 
         # 1. Always generate a clean featured / hero image (results[0])
         pillar = getattr(draft, "smartscaling_pillar", "") or ""
-        featured = self.generate_featured_image(
-            title=getattr(draft, "title", "RevHeat"),
-            subtitle=getattr(draft, "meta_description", "")[:100] if hasattr(draft, "meta_description") else "",
-            pillar=pillar,
-        )
-        results.append(featured)
+        jobs.append((self.generate_featured_image, {
+            "title": getattr(draft, "title", "RevHeat"),
+            "subtitle": getattr(draft, "meta_description", "")[:100] if hasattr(draft, "meta_description") else "",
+            "pillar": pillar,
+        }))
 
         # 2. Data chart — goes into the post body, not as featured image
         chart_data = self.extract_chart_data_from_draft(draft)
-        chart = self.generate_data_chart(
-            data=chart_data,
-            chart_type="comparison_bar",
-            title=getattr(draft, "title", "RevHeat Data Insight"),
-            subtitle="Data from 33,000 companies — RevHeat Research",
-        )
-        results.append(chart)
+        jobs.append((self.generate_data_chart, {
+            "data": chart_data,
+            "chart_type": "comparison_bar",
+            "title": getattr(draft, "title", "RevHeat Data Insight"),
+            "subtitle": "Data from 33,000 companies — RevHeat Research",
+        }))
 
         # 3. If comparison table exists, generate comparison graphic with real data
         if hasattr(draft, "comparison_table") and draft.comparison_table:
             before_data, after_data = self.extract_comparison_data_from_draft(draft)
-            comparison = self.generate_comparison_graphic(
-                before_data=before_data,
-                after_data=after_data,
-                title=getattr(draft, "title", "Comparison"),
-            )
-            results.append(comparison)
+            jobs.append((self.generate_comparison_graphic, {
+                "before_data": before_data,
+                "after_data": after_data,
+                "title": getattr(draft, "title", "Comparison"),
+            }))
 
         # 4. If quotable line, generate quote card
         if hasattr(draft, "key_takeaway") and draft.key_takeaway:
             quote_text = draft.key_takeaway[:140]
-            quote = self.generate_quote_card(quote_text)
-            results.append(quote)
+            jobs.append((self.generate_quote_card, {"quote_text": quote_text}))
+
+        # Every job here is Pillow-only (comparison_bar renders through PIL) and
+        # draws its own Image into its own output file. Font paths are resolved
+        # here, serially, so the workers only read them; each worker then loads
+        # its own FreeType faces through the per-thread font cache
+        for bold in (False, True):
+            self._get_font(24, bold=bold)
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = [pool.submit(fn, **kwargs) for fn, kwargs in jobs]
+            results = [future.result() for future in futures]
 
         # Compress all
-        for result in results:
-            try:
-                compressed_path = self.compress_image(result.path)
+        compressed = self.compress_images([result.path for result in results])
+        for result, compressed_path in zip(results, compressed):
+            if compressed_path != result.path:
                 result.path = compressed_path
                 result.format = "webp"
-            except Exception as e:
-                log.warning(f"Compression failed for {result.path}: {e}")
 
         log.info(f"Image pipeline complete: {len(results)} images generated")
         return results
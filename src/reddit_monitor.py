@@ -17,8 +17,15 @@ load_dotenv(override=True)
 
 log = logging.getLogger(__name__)
 
+# Title substrings per response type, checked in priority order
+_RESPONSE_TYPE_PATTERNS = [
+    ("question_answer", re.compile(r"how do|how to|how can|what should|\?", re.IGNORECASE)),
+    ("framework_share", re.compile(r"framework|system|process|methodology", re.IGNORECASE)),
+    ("data_insight", re.compile(r"data|metric|benchmark|stat|number", re.IGNORECASE)),
+]
 
-@dataclass
+
+@dataclass(slots=True)
 class RedditThread:
     id: str
     subreddit: str
@@ -33,7 +40,7 @@ class RedditThread:
     flair: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredOpportunity:
     thread: RedditThread
     priority_score: float
@@ -71,6 +78,7 @@ class RedditMonitor:
         self.competitor_keywords = self.config.get("competitor_keywords", [])
         self.subreddits = self.config.get("subreddits", [])
         self.keyword_mapping = self.config.get("keyword_mapping", {})
+        self._smartscaling_table = self._build_smartscaling_table(self.keyword_mapping)
 
         # Reddit API client
         self.reddit = self._init_reddit()
@@ -142,10 +150,18 @@ class RedditMonitor:
         log.info(f"Scanned {len(subreddit_list)} subreddits, found {len(threads)} matching threads")
         return threads
 
+    @staticmethod
+    def _keyword_regex(keywords_lower: list[str]) -> re.Pattern:
+        """One alternation over all keywords, used to reject non-matching posts in a single scan."""
+        if not keywords_lower:
+            return re.compile(r"(?!)")  # never matches
+        return re.compile("|".join(map(re.escape, keywords_lower)))
+
     def _scan_via_api(self, subreddit_list, keywords_lower, cutoff) -> list[RedditThread]:
         """Scan using PRAW Reddit API."""
         threads = []
         sub_config = {s["name"]: s for s in self.subreddits}
+        keyword_re = self._keyword_regex(keywords_lower)
 
         for sub_name in subreddit_list:
             config = sub_config.get(sub_name, {})
@@ -164,6 +180,8 @@ class RedditMonitor:
 
                     title_lower = submission.title.lower()
                     body_lower = (submission.selftext or "").lower()
+                    if not (keyword_re.search(title_lower) or keyword_re.search(body_lower)):
+                        continue
                     matched = [
                         kw for kw in keywords_lower
                         if kw in title_lower or kw in body_lower
@@ -199,6 +217,8 @@ class RedditMonitor:
 
         import requests
 
+        keyword_re = self._keyword_regex(keywords_lower)
+
         for sub_name in subreddit_list:
             try:
                 feed_url = f"https://www.reddit.com/r/{sub_name}/new/.rss"
@@ -208,6 +228,8 @@ class RedditMonitor:
                 for entry in feed.entries:
                     title_lower = entry.title.lower()
                     summary_lower = entry.get("summary", "").lower()
+                    if not (keyword_re.search(title_lower) or keyword_re.search(summary_lower)):
+                        continue
 
                     matched = [
                         kw for kw in keywords_lower
@@ -234,69 +256,101 @@ class RedditMonitor:
 
     def score_opportunity(self, thread: RedditThread) -> ScoredOpportunity:
         """Score a thread for engagement opportunity (0-100)."""
-        score = 0
+        return self.score_opportunities_batch([thread])[0]
 
-        # Keyword match strength (0-25)
-        primary_matches = sum(
-            1 for kw in self.primary_keywords
-            if kw.lower() in thread.title.lower() or kw.lower() in thread.body.lower()
-        )
-        score += min(primary_matches * 10, 25)
+    def score_opportunities_batch(self, threads: list[RedditThread]) -> list[ScoredOpportunity]:
+        """Score threads for engagement opportunity (0-100), in input order.
+
+        Freshness and engagement are bucketed column-wise with NumPy; text
+        features are still per-thread.
+        """
+        if not threads:
+            return []
+
+        import numpy as np
+
+        count = len(threads)
+        created = np.fromiter((t.created_utc for t in threads), dtype=np.float64, count=count)
+        comments = np.fromiter((t.num_comments for t in threads), dtype=np.int64, count=count)
 
         # Thread freshness (0-20)
-        hours_old = (time.time() - thread.created_utc) / 3600
-        if hours_old < 2:
-            score += 20
-        elif hours_old < 6:
-            score += 15
-        elif hours_old < 12:
-            score += 10
-        elif hours_old < 24:
-            score += 5
+        hours_old = (time.time() - created) / 3600
+        freshness = np.select(
+            [hours_old < 2, hours_old < 6, hours_old < 12, hours_old < 24],
+            [20, 15, 10, 5],
+            default=0,
+        )
 
         # Engagement level (0-20) — low comments = opportunity
-        if thread.num_comments < 5:
-            score += 20
-        elif thread.num_comments < 15:
-            score += 15
-        elif thread.num_comments < 30:
-            score += 10
-
-        # Subreddit size (0-15)
-        score += self.SUB_SIZES.get(thread.subreddit, 5)
-
-        # SMARTSCALING relevance (0-20)
-        pillar, function = self.map_to_smartscaling(thread)
-        if pillar:
-            score += 20
-        elif function:
-            score += 10
-
-        urgency = "high" if score > 70 else "medium" if score > 40 else "low"
-
-        return ScoredOpportunity(
-            thread=thread,
-            priority_score=score,
-            smartscaling_pillar=pillar,
-            smartscaling_function=function,
-            suggested_angle=self._suggest_angle(thread, pillar, function),
-            response_type=self._classify_response_type(thread),
-            urgency=urgency,
+        engagement = np.select(
+            [comments < 5, comments < 15, comments < 30],
+            [20, 15, 10],
+            default=0,
         )
 
+        primary_lower = [kw.lower() for kw in self.primary_keywords]
+        opportunities = []
+
+        for thread, score in zip(threads, (freshness + engagement).tolist()):
+            # Keyword match strength (0-25)
+            title_lower = thread.title.lower()
+            body_lower = thread.body.lower()
+            primary_matches = sum(
+                1 for kw in primary_lower
+                if kw in title_lower or kw in body_lower
+            )
+            score += min(primary_matches * 10, 25)
+
+            # Subreddit size (0-15)
+            score += self.SUB_SIZES.get(thread.subreddit, 5)
+
+            # SMARTSCALING relevance (0-20)
+            pillar, function = self.map_to_smartscaling(thread)
+            if pillar:
+                score += 20
+            elif function:
+                score += 10
+
+            urgency = "high" if score > 70 else "medium" if score > 40 else "low"
+
+            opportunities.append(ScoredOpportunity(
+                thread=thread,
+                priority_score=score,
+                smartscaling_pillar=pillar,
+                smartscaling_function=function,
+                suggested_angle=self._suggest_angle(thread, pillar, function),
+                response_type=self._classify_response_type(thread),
+                urgency=urgency,
+            ))
+
+        return opportunities
+
+    @staticmethod
+    def _build_smartscaling_table(keyword_mapping: dict) -> list[tuple[re.Pattern, tuple[str, str]]]:
+        """Compile each "kw1|kw2" mapping pattern into one regex, in config order."""
+        table = []
+        for category, mappings in keyword_mapping.items():
+            if not isinstance(mappings, dict):
+                continue
+            for pattern, target in mappings.items():
+                if isinstance(target, dict):
+                    result = (target.get("pillar", ""), target.get("function", ""))
+                elif isinstance(target, list) and len(target) >= 2:
+                    result = (target[0], target[1])
+                else:
+                    continue
+                keywords = (kw.strip().lower() for kw in pattern.split("|"))
+                table.append((re.compile("|".join(map(re.escape, keywords))), result))
+        return table
+
     def map_to_smartscaling(self, thread: RedditThread) -> tuple[str, str]:
         """Map thread keywords to SMARTSCALING pillar and function."""
         text = f"{thread.title} {thread.body}".lower()
 
-        for category, mappings in self.keyword_mapping.items():
-            if isinstance(mappings, dict):
-                for pattern, target in mappings.items():
-                    keywords = pattern.split("|")
-                    if any(kw.strip().lower() in text for kw in keywords):
-                        if isinstance(target, dict):
-                            return target.get("pillar", ""), target.get("function", "")
-                        elif isinstance(target, list) and len(target) >= 2:
-                            return target[0], target[1]
+        # First mapping (in config order) with any substring hit wins
+        for regex, result in self._smartscaling_table:
+            if regex.search(text):
+                return result
 
         return "", ""
 
@@ -310,14 +364,9 @@ class RedditMonitor:
 
     def _classify_response_type(self, thread: RedditThread) -> str:
         """Classify the best response type based on thread content."""
-        title_lower = thread.title.lower()
-
-        if any(w in title_lower for w in ["how do", "how to", "how can", "what should", "?"]):
-            return "question_answer"
-        if any(w in title_lower for w in ["framework", "system", "process", "methodology"]):
-            return "framework_share"
-        if any(w in title_lower for w in ["data", "metric", "benchmark", "stat", "number"]):
-            return "data_insight"
+        for response_type, pattern in _RESPONSE_TYPE_PATTERNS:
+            if pattern.search(thread.title):
+                return response_type
         return "hot_take"
 
     def generate_response_draft(self, opportunity: ScoredOpportunity) -> str:
@@ -488,7 +537,7 @@ Key points to cover:
         threads = self.scan_subreddits()
 
         # 2. Score each thread
-        opportunities = [self.score_opportunity(t) for t in threads]
+        opportunities = self.score_opportunities_batch(threads)
 
         # 3. Send daily brief
         self.send_daily_brief(opportunities)
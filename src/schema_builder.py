@@ -1,17 +1,37 @@
 """Schema Builder — generates and validates JSON-LD structured data for blog posts."""
 
+import functools
 import json
 import logging
 import os
 import re
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
 import yaml
 from jinja2 import Environment, FileSystemLoader
 
+from src.utils.serialization import dumps_json
+
 log = logging.getLogger(__name__)
 
+# Templates loop over plain tuples: Jinja's `item.question` on a dict tries getattr
+# (and raises) before falling back to item lookup, once per field per row
+_FAQ_PAIR = itemgetter("question", "answer")
+_HOWTO_STEP_ROW = itemgetter("title", "description")
+
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2})?")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_iso_date(date_str: str) -> bool:
+    """Check the ISO 8601 date prefix; cached since a site rebuild repeats the same dates."""
+    # Cheap reject before the regex: anything valid starts with YYYY-MM-DD
+    if len(date_str) < 10 or date_str[4] != "-":
+        return False
+    return bool(_ISO_DATE_RE.match(date_str))
+
 
 @dataclass
 class ValidationResult:
@@ -29,6 +49,7 @@ class SchemaBuilder:
             loader=FileSystemLoader(templates_dir),
             autoescape=False,
         )
+        self._templates = {}
 
         # Load pillar-cluster mapping for breadcrumbs
         self.pillar_map = {}
@@ -36,11 +57,19 @@ class SchemaBuilder:
             with open(pillar_map_path) as f:
                 self.pillar_map = yaml.safe_load(f) or {}
 
+        # Per-@type validators, bound once and reused by every validate_schema call
+        self._validators = {
+            "Article": self._validate_article,
+            "FAQPage": self._validate_faq,
+            "HowTo": self._validate_howto,
+            "BreadcrumbList": self._validate_breadcrumb,
+        }
+
         log.info("SchemaBuilder initialized")
 
     def build_article_schema(self, post_data: dict) -> dict:
         """Build Article JSON-LD from post data."""
-        template = self.env.get_template("article-template.json")
+        template = self._template("article-template.json")
 
         defaults = {
             "primary_topic": post_data.get("smartscaling_pillar", "Sales Optimization"),
@@ -57,8 +86,8 @@ class SchemaBuilder:
 
     def build_faq_schema(self, faq_items: list[dict], post_url: str = "") -> dict:
         """Build FAQPage JSON-LD from FAQ items."""
-        template = self.env.get_template("faqpage-template.json")
-        rendered = template.render(faq_items=faq_items, post_url=post_url)
+        template = self._template("faqpage-template.json")
+        rendered = template.render(faq_pairs=list(map(_FAQ_PAIR, faq_items)), post_url=post_url)
         return json.loads(rendered)
 
     def build_howto_schema(self, howto_data: dict) -> dict:
@@ -66,8 +95,9 @@ class SchemaBuilder:
         if not howto_data or not howto_data.get("steps"):
             return {}
 
-        template = self.env.get_template("howto-template.json")
-        rendered = template.render(**howto_data)
+        template = self._template("howto-template.json")
+        step_rows = [(*_HOWTO_STEP_ROW(step), step.get("image_url")) for step in howto_data["steps"]]
+        rendered = template.render(**howto_data, step_rows=step_rows)
         return json.loads(rendered)
 
     def build_breadcrumb_schema(self, pillar: str, cluster: str, post_title: str, post_url: str) -> dict:
@@ -75,7 +105,7 @@ class SchemaBuilder:
         pillar_name, pillar_slug = self._resolve_pillar(pillar)
         cluster_name, cluster_slug = self._resolve_cluster(pillar, cluster)
 
-        template = self.env.get_template("breadcrumb-template.json")
+        template = self._template("breadcrumb-template.json")
         rendered = template.render(
             post_url=post_url,
             pillar_name=pillar_name,
@@ -86,6 +116,13 @@ class SchemaBuilder:
         )
         return json.loads(rendered)
 
+    def _template(self, name: str):
+        """Return a compiled template, loading it on first use only."""
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.env.get_template(name)
+        return template
+
     def _resolve_pillar(self, pillar: str) -> tuple[str, str]:
         """Map pillar name to display name and slug."""
         pillar_key = pillar.lower().strip()
@@ -117,46 +154,47 @@ class SchemaBuilder:
         slug = re.sub(r"[^a-z0-9]+", "-", cluster.lower()).strip("-")
         return cluster, slug
 
-    def build_full_graph(self, post_data: dict) -> dict:
-        """Build complete @graph with Article, BreadcrumbList, and optional FAQ/HowTo."""
-        graph = []
-
-        # Always include Article
-        article = self.build_article_schema(post_data)
-        graph.append(article)
+    def _graph_article(self, post_data: dict) -> dict:
+        return self.build_article_schema(post_data)
 
-        # Always include BreadcrumbList
-        breadcrumb = self.build_breadcrumb_schema(
+    def _graph_breadcrumb(self, post_data: dict) -> dict:
+        return self.build_breadcrumb_schema(
             pillar=post_data.get("smartscaling_pillar", ""),
             cluster=post_data.get("smartscaling_function", post_data.get("smartscaling_pillar", "")),
             post_title=post_data.get("post_title", ""),
             post_url=post_data.get("post_url", ""),
         )
-        graph.append(breadcrumb)
-
-        # Optional FAQPage
-        faq_items = post_data.get("faq_items", [])
-        if faq_items:
-            faq = self.build_faq_schema(faq_items, post_data.get("post_url", ""))
-            graph.append(faq)
-
-        # Optional HowTo
-        howto_steps = post_data.get("howto_steps")
-        if howto_steps:
-            howto_data = {
-                "title": post_data.get("post_title", ""),
-                "description": post_data.get("meta_description", ""),
-                "estimated_time": post_data.get("estimated_time", ""),
-                "steps": howto_steps,
-                "post_url": post_data.get("post_url", ""),
-            }
-            howto = self.build_howto_schema(howto_data)
-            if howto:
-                graph.append(howto)
 
+    def _graph_faq(self, post_data: dict) -> dict:
+        return self.build_faq_schema(post_data["faq_items"], post_data.get("post_url", ""))
+
+    def _graph_howto(self, post_data: dict) -> dict:
+        return self.build_howto_schema({
+            "title": post_data.get("post_title", ""),
+            "description": post_data.get("meta_description", ""),
+            "estimated_time": post_data.get("estimated_time", ""),
+            "steps": post_data["howto_steps"],
+            "post_url": post_data.get("post_url", ""),
+        })
+
+    # @graph nodes in output order: (post_data key that enables the node, builder).
+    # A None key means the node is always included.
+    _GRAPH_BUILDERS = (
+        (None, _graph_article),
+        (None, _graph_breadcrumb),
+        ("faq_items", _graph_faq),
+        ("howto_steps", _graph_howto),
+    )
+
+    def build_full_graph(self, post_data: dict) -> dict:
+        """Build complete @graph with Article, BreadcrumbList, and optional FAQ/HowTo."""
         return {
             "@context": "https://schema.org",
-            "@graph": graph,
+            "@graph": list(filter(None, (
+                build(self, post_data)
+                for key, build in self._GRAPH_BUILDERS
+                if key is None or post_data.get(key)
+            ))),
         }
 
     def validate_schema(self, json_ld: dict) -> ValidationResult:
@@ -167,16 +205,13 @@ class SchemaBuilder:
         graph = json_ld.get("@graph", [json_ld])
 
         for item in graph:
+            # JSON-LD allows @type to be a single type or a list of types
             schema_type = item.get("@type", "")
-
-            if schema_type == "Article":
-                self._validate_article(item, errors, warnings)
-            elif schema_type == "FAQPage":
-                self._validate_faq(item, errors, warnings)
-            elif schema_type == "HowTo":
-                self._validate_howto(item, errors, warnings)
-            elif schema_type == "BreadcrumbList":
-                self._validate_breadcrumb(item, errors, warnings)
+            types = schema_type if isinstance(schema_type, list) else [schema_type]
+            for t in types:
+                validator = self._validators.get(t) if isinstance(t, str) else None
+                if validator:
+                    validator(item, errors, warnings)
 
         return ValidationResult(
             valid=len(errors) == 0,
@@ -239,21 +274,22 @@ class SchemaBuilder:
                 warnings.append(f"Breadcrumb item {i+1} missing 'item' URL")
 
     def _is_valid_iso_date(self, date_str: str) -> bool:
-        iso_pattern = r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2})?"
-        return bool(re.match(iso_pattern, date_str))
+        return _is_iso_date(date_str)
 
     def inject_into_html(self, html_content: str, json_ld: dict) -> str:
         """Inject JSON-LD schema into HTML content."""
-        script_tag = (
-            '<script type="application/ld+json">'
-            + json.dumps(json_ld, separators=(",", ":"))
-            + "</script>"
-        )
-
-        # Insert before </body> if present, else append
-        if "</body>" in html_content:
-            return html_content.replace("</body>", f"{script_tag}\n</body>")
-        return html_content + "\n" + script_tag
+        payload = dumps_json(json_ld).decode()
+
+        # Insert before the closing </body> if present, else append. One join
+        # sizes the result once instead of copying the document per `+`.
+        body_end = html_content.rfind("</body>")
+        if body_end != -1:
+            return "".join((
+                html_content[:body_end],
+                '<script type="application/ld+json">', payload, "</script>\n",
+                html_content[body_end:],
+            ))
+        return "".join((html_content, '\n<script type="application/ld+json">', payload, "</script>"))
 
     def deploy_site_schemas(self) -> str:
         """Generate PHP snippet for site-wide Organization/Person/WebSite/Service schemas.
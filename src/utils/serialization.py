@@ -0,0 +1,16 @@
+"""Shared JSON encoding and YAML loading for the RevHeat Blog Engine."""
+
+import orjson
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml C binding
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Non-str dict keys are stringified the way json.dumps does instead of raising
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(obj) -> bytes:
+    """Encode obj as compact UTF-8 JSON (no whitespace, non-ASCII unescaped)."""
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS)
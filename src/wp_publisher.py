@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import base64
+import functools
 import logging
 import mimetypes
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from src.utils.serialization import dumps_json
 
 load_dotenv(override=True)
 
@@ -25,6 +30,14 @@ class PermissionError_(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=512)
+def _normalize_category_slug(slug: str) -> str:
+    """Normalize to proper slug format: lowercase, hyphens, no special chars."""
+    slug = slug.lower().strip().replace(" ", "-").replace("&", "and")
+    slug = re.sub(r"[^a-z0-9-]", "", slug)
+    return re.sub(r"-+", "-", slug).strip("-")
+
+
 class WordPressPublisher:
     """Handles all WordPress REST API interactions."""
 
@@ -42,12 +55,33 @@ class WordPressPublisher:
             "Content-Type": "application/json",
         }
 
-        # Caches
+        # One pooled session so every call reuses the keep-alive connection;
+        # retries stay in _request, so the adapter does none of its own
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Caches (bulk runs share one publisher, e.g. ContentEngine.wp, to reuse them)
         self._category_cache: dict[str, int] = {}
         self._tag_cache: dict[str, int] = {}
 
-        # Verify connection
-        self._verify_connection()
+        # Verify connection; don't leak the session if that fails
+        try:
+            self._verify_connection()
+        except Exception:
+            self._session.close()
+            raise
+
+    def close(self):
+        """Close the pooled session and its keep-alive connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _verify_connection(self):
         """Verify WP REST API is reachable and authenticated."""
@@ -61,14 +95,21 @@ class WordPressPublisher:
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(f"Cannot reach WordPress at {self.base_url}: {e}")
 
-    def _request(self, method, url, retries=3, timeout=30, **kwargs):
-        """Make an HTTP request with retry logic and error handling."""
+    def _request(self, method, url, retries=3, timeout=30, headers=None, **kwargs):
+        """Make an HTTP request with retry logic and error handling.
+
+        ``headers`` are merged over the default auth/JSON headers for this call only.
+        """
+        request_headers = {**self.headers, **headers} if headers else self.headers
+        if "json" in kwargs:
+            # Serialize once up front (Content-Type is already application/json)
+            kwargs["data"] = dumps_json(kwargs.pop("json"))
         last_exception = None
         for attempt in range(retries):
             try:
                 start = time.time()
-                resp = requests.request(
-                    method, url, headers=self.headers, timeout=timeout, **kwargs
+                resp = self._session.request(
+                    method, url, headers=request_headers, timeout=timeout, **kwargs
                 )
                 elapsed = time.time() - start
 
@@ -224,21 +265,17 @@ class WordPressPublisher:
         with open(path, "rb") as f:
             file_data = f.read()
 
-        # Temporarily swap headers for binary upload
-        original_headers = self.headers.copy()
-        self.headers["Content-Type"] = mime_type
-        self.headers["Content-Disposition"] = f'attachment; filename="{path.name}"'
-
-        try:
-            resp = self._request(
-                "POST",
-                f"{self.api_base}/media",
-                data=file_data,
-                timeout=60,
-            )
-        finally:
-            # Restore original headers
-            self.headers = original_headers
+        # Per-call headers for the binary upload (self.headers is shared across threads)
+        resp = self._request(
+            "POST",
+            f"{self.api_base}/media",
+            data=file_data,
+            timeout=60,
+            headers={
+                "Content-Type": mime_type,
+                "Content-Disposition": f'attachment; filename="{path.name}"',
+            },
+        )
 
         resp.raise_for_status()
         media = resp.json()
@@ -255,6 +292,14 @@ class WordPressPublisher:
         log.info(f"Uploaded image: {media_id} - {path.name}")
         return media_id
 
+    def upload_images(self, images, max_workers=4) -> list[int]:
+        """Upload (image_path, alt_text) pairs concurrently; media IDs come back in input order."""
+        images = list(images)
+        if len(images) <= 1:
+            return [self.upload_image(path, alt) for path, alt in images]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as pool:
+            return list(pool.map(lambda item: self.upload_image(*item), images))
+
     def set_featured_image(self, post_id, media_id) -> bool:
         """Set the featured image for a post."""
         resp = self._request(
@@ -287,10 +332,7 @@ class WordPressPublisher:
 
     def get_category_id(self, slug) -> int:
         """Look up category ID by slug, using cache."""
-        # Normalize to proper slug format: lowercase, hyphens, no special chars
-        slug = slug.lower().strip().replace(" ", "-").replace("&", "and")
-        slug = re.sub(r"[^a-z0-9-]", "", slug)
-        slug = re.sub(r"-+", "-", slug).strip("-")
+        slug = _normalize_category_slug(slug)
 
         if slug in self._category_cache:
             return self._category_cache[slug]
@@ -330,9 +372,10 @@ class WordPressPublisher:
         log.warning(f"Failed to create tag: {slug}")
         return 0
 
-    def set_seo_meta(self, post_id, seo_title, meta_desc, focus_keyword,
-                     secondary_keywords=None, robots="index,follow") -> bool:
-        """Set Rank Math SEO meta fields on a post."""
+    @staticmethod
+    def _seo_meta(seo_title, meta_desc, focus_keyword,
+                  secondary_keywords=None, robots="index,follow") -> dict:
+        """Rank Math SEO meta fields, as sent by set_seo_meta."""
         meta = {
             "rank_math_title": seo_title,
             "rank_math_description": meta_desc,
@@ -346,21 +389,11 @@ class WordPressPublisher:
                 meta["rank_math_focus_keyword"] = ",".join(
                     [focus_keyword] + secondary_keywords[:4]
                 )
+        return meta
 
-        resp = self._request(
-            "POST",
-            f"{self.api_base}/posts/{post_id}",
-            json={"meta": meta},
-        )
-        return 200 <= resp.status_code < 300
-
-    def set_social_meta(self, post_id, title, description, image_url="",
-                        author_twitter="@RevHeat") -> bool:
-        """Set OpenGraph + Twitter Card meta via Rank Math custom fields.
-
-        Rank Math stores OG/Twitter meta as post meta fields. When present,
-        it renders the corresponding <meta> tags in the HTML head.
-        """
+    @staticmethod
+    def _social_meta(title, description, image_url="", author_twitter="@RevHeat") -> dict:
+        """Rank Math OpenGraph + Twitter Card meta fields, as sent by set_social_meta."""
         meta = {
             # OpenGraph
             "rank_math_facebook_title": title,
@@ -376,7 +409,27 @@ class WordPressPublisher:
         if image_url:
             meta["rank_math_facebook_image"] = image_url
             meta["rank_math_twitter_image"] = image_url
+        return meta
 
+    def set_seo_meta(self, post_id, seo_title, meta_desc, focus_keyword,
+                     secondary_keywords=None, robots="index,follow") -> bool:
+        """Set Rank Math SEO meta fields on a post."""
+        meta = self._seo_meta(seo_title, meta_desc, focus_keyword, secondary_keywords, robots)
+        resp = self._request(
+            "POST",
+            f"{self.api_base}/posts/{post_id}",
+            json={"meta": meta},
+        )
+        return 200 <= resp.status_code < 300
+
+    def set_social_meta(self, post_id, title, description, image_url="",
+                        author_twitter="@RevHeat") -> bool:
+        """Set OpenGraph + Twitter Card meta via Rank Math custom fields.
+
+        Rank Math stores OG/Twitter meta as post meta fields. When present,
+        it renders the corresponding <meta> tags in the HTML head.
+        """
+        meta = self._social_meta(title, description, image_url, author_twitter)
         resp = self._request(
             "POST",
             f"{self.api_base}/posts/{post_id}",
@@ -424,6 +477,51 @@ class WordPressPublisher:
         )
         return 200 <= resp.status_code < 300
 
+    def batch_update(self, post_id, meta=None, categories=None, tags=None,
+                     date=None, status=None, featured_media=None, seo=None,
+                     social=None, canonical_url=None) -> bool:
+        """Apply meta, taxonomy and scheduling changes to a post in one request.
+
+        Every field targets the same post, so they are merged into a single
+        posts/{id} update instead of one round trip per setter. ``seo`` and
+        ``social`` take the keyword arguments of set_seo_meta and
+        set_social_meta (without post_id).
+        """
+        merged_meta = dict(meta or {})
+        if seo:
+            merged_meta.update(self._seo_meta(**seo))
+        if social:
+            merged_meta.update(self._social_meta(**social))
+        if canonical_url:
+            merged_meta["rank_math_canonical_url"] = canonical_url
+
+        payload = {}
+        if merged_meta:
+            payload["meta"] = merged_meta
+        if featured_media:
+            payload["featured_media"] = featured_media
+        # Same filtering as assign_taxonomy (0 means lookup failed)
+        valid_categories = [cid for cid in (categories or []) if cid and cid > 0]
+        valid_tags = [tid for tid in (tags or []) if tid and tid > 0]
+        if valid_categories:
+            payload["categories"] = valid_categories
+        if valid_tags:
+            payload["tags"] = valid_tags
+        if date is not None:
+            payload["date"] = date.isoformat() if hasattr(date, "isoformat") else date
+        if status is not None:
+            payload["status"] = status
+
+        if not payload:
+            log.warning(f"batch_update called with no fields for post {post_id}")
+            return True  # Nothing to do, not an error
+
+        resp = self._request(
+            "POST", f"{self.api_base}/posts/{post_id}", json=payload
+        )
+        log.info(f"Batch updated post {post_id}: {', '.join(payload)}")
+        return 200 <= resp.status_code < 300
+
     def get_draft_queue(self) -> list[dict]:
         """Get list of draft posts, ordered by date."""
         resp = self._request(
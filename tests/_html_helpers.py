@@ -0,0 +1,6 @@
+"""Shared HTML assertions for the Content Engine tests."""
+
+
+def _count_hrefs(html, url):
+    """Count anchors in html pointing at url."""
+    return html.count(f'href="{url}"')
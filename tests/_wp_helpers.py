@@ -0,0 +1,19 @@
+"""Shared HTTP stubs for the WordPress Publisher tests."""
+
+import re
+
+import responses
+
+
+def _register_stubs(api_base, stubs=(), verify=True):
+    """Register the connection check plus (method, path, json, status) stubs, in order.
+
+    String paths are relative to ``api_base``; a compiled ``re.Pattern`` is
+    matched against the full URL as-is. ``verify=False`` leaves the connection
+    check for the test to register itself.
+    """
+    if verify:
+        responses.add(responses.GET, f"{api_base}/", json={"name": "RevHeat"}, status=200)
+    for method, path, body, status in stubs:
+        url = path if isinstance(path, re.Pattern) else f"{api_base}{path}"
+        responses.add(method, url, json=body, status=status)
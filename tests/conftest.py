@@ -0,0 +1,15 @@
+"""Shared test fixtures."""
+
+import os
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(PROJECT_ROOT, "config.yaml")
+
+
+@pytest.fixture(scope="session")
+def shared_engine():
+    """ContentEngine for stateless single-call tests, built once per session."""
+    from src.content_engine import ContentEngine
+    return ContentEngine(config_path=CONFIG_PATH)
@@ -0,0 +1,120 @@
+"""Tests for the pure helpers behind the Content Engine (no config or engine needed)."""
+
+import pytest
+
+from src.content_engine import _count_statistics, _inject_planned_links
+from src.draft_ingester import DraftIngester
+from tests._html_helpers import _count_hrefs
+
+SITE_URL = "https://revheat.com"
+
+
+@pytest.mark.parametrize("text,expected_min", [
+    ("47%", 1),
+    ("$5.2M", 1),
+    ("3.4x across 33,000", 2),
+    ("Win rate is 47%. Revenue jumped to $5.2M with a 3.4x improvement across 33,000 companies.", 4),
+])
+def test_count_statistics(text, expected_min):
+    """Verify stat counter finds percentages, dollars, multipliers, large numbers."""
+    assert _count_statistics(text) >= expected_min
+
+
+def test_inject_planned_links_basic():
+    """Planned links from frontmatter are injected into HTML content."""
+    content = "<p>Improving your sales process architecture is critical for growth.</p>"
+    planned_links = [
+        {"anchor": "sales process architecture", "target": "/blog/sales-process-architecture/", "type": "pillar"},
+    ]
+    result = _inject_planned_links(content, planned_links, SITE_URL)
+    assert '<a href="https://revheat.com/blog/sales-process-architecture/">' in result
+    assert "sales process architecture</a>" in result
+
+
+def test_inject_planned_links_empty():
+    """No changes when planned links list is empty."""
+    content = "<p>Some content here.</p>"
+    result = _inject_planned_links(content, [], SITE_URL)
+    assert result == content
+
+
+def test_inject_planned_links_absolute_url():
+    """Absolute URLs are used as-is."""
+    content = "<p>Read the revenue operations guide for more info.</p>"
+    planned_links = [
+        {"anchor": "revenue operations guide", "target": "https://revheat.com/blog/rev-ops/", "type": "internal"},
+    ]
+    result = _inject_planned_links(content, planned_links, SITE_URL)
+    assert 'href="https://revheat.com/blog/rev-ops/"' in result
+
+
+def test_inject_planned_links_skips_headings():
+    """Links are not injected inside headings."""
+    content = "<h2>Sales Process Architecture</h2><p>Some content about sales process architecture.</p>"
+    planned_links = [
+        {"anchor": "Sales Process Architecture", "target": "/blog/spa/", "type": "pillar"},
+    ]
+    result = _inject_planned_links(content, planned_links, SITE_URL)
+    # Should NOT link inside the h2
+    assert "<h2><a" not in result
+    # Should link inside the p
+    assert '<a href="https://revheat.com/blog/spa/">' in result
+
+
+def test_inject_planned_links_one_per_anchor():
+    """Only one link is created per anchor text, even if it appears multiple times."""
+    content = "<p>Revenue operations are key.</p><p>Revenue operations drive growth.</p>"
+    planned_links = [
+        {"anchor": "Revenue operations", "target": "/blog/rev-ops/", "type": "internal"},
+    ]
+    result = _inject_planned_links(content, planned_links, SITE_URL)
+    assert _count_hrefs(result, "https://revheat.com/blog/rev-ops/") == 1
+
+
+class TestNormalizedInternalLinks:
+    def test_normalize_internal_links(self):
+        """Frontmatter internal_links dict is normalized to flat list."""
+        raw = {
+            "pillar_link": {
+                "anchor": "SmartScaling Strategy",
+                "target": "/blog/smartscaling-strategy/",
+            },
+            "cross_pillar_link": {
+                "anchor": "Revenue Operations",
+                "target": "/blog/revenue-operations/",
+            },
+            "sibling_link": {
+                "anchor": "Sales Process",
+                "target": "/blog/sales-process/",
+            },
+        }
+        result = DraftIngester._normalize_internal_links(raw)
+        assert len(result) == 3
+        types = {link["type"] for link in result}
+        assert "pillar" in types
+        assert "cross_pillar" in types
+        assert "sibling" in types
+
+    def test_normalize_empty(self):
+        """Empty dict returns empty list."""
+        assert DraftIngester._normalize_internal_links({}) == []
+
+    def test_normalize_skips_invalid(self):
+        """Non-dict values and missing fields are skipped."""
+        raw = {
+            "good": {"anchor": "Link Text", "target": "/blog/page/"},
+            "bad_string": "not a dict",
+            "missing_anchor": {"target": "/blog/x/"},
+            "missing_target": {"anchor": "Text"},
+        }
+        result = DraftIngester._normalize_internal_links(raw)
+        assert len(result) == 1
+        assert result[0]["anchor"] == "Link Text"
+
+    def test_normalize_returns_fresh_dicts(self):
+        """Mutating a normalized result does not leak into later calls."""
+        raw = {"pillar_link": {"anchor": "Strategy", "target": "/blog/strategy/"}}
+        first = DraftIngester._normalize_internal_links(raw)
+        first[0]["anchor"] = "Mutated"
+        second = DraftIngester._normalize_internal_links(raw)
+        assert second[0]["anchor"] == "Strategy"
@@ -1,14 +1,17 @@
 """Tests for the Draft Ingester module."""
 
+import functools
 import os
-import tempfile
 import pytest
-from pathlib import Path
+import yaml
+from datetime import date
+from pathlib import Path, PurePosixPath
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 from src.draft_ingester import DraftIngester
 from src.content_engine import ContentEngine, TopicSelection, BlogDraft
+from src.utils.serialization import YamlLoader
 
 
 # ---------------------------------------------------------------------------
@@ -16,7 +19,16 @@ from src.content_engine import ContentEngine, TopicSelection, BlogDraft
 # ---------------------------------------------------------------------------
 SEO_MACHINE_ROOT = os.path.dirname(PROJECT_ROOT)
 DRAFTS_DIR = os.path.join(SEO_MACHINE_ROOT, "04-Blog-Drafts")
-HAS_DRAFTS = os.path.isdir(DRAFTS_DIR)
+
+
+@functools.lru_cache(maxsize=32)
+def _ls(path):
+    """Directory listing as a frozenset, cached so skip checks cost one listdir per directory."""
+    return frozenset(os.listdir(path)) if os.path.isdir(path) else frozenset()
+
+
+HAS_DRAFTS = bool(_ls(DRAFTS_DIR))
+HAS_CONTENT_MAP = "pillar_cluster_map.yaml" in _ls(os.path.join(PROJECT_ROOT, "data"))
 
 
 @pytest.fixture
@@ -30,10 +42,9 @@ def ingester_with_map():
     """DraftIngester loaded with the real content map."""
     map_path = os.path.join(PROJECT_ROOT, "data", "pillar_cluster_map.yaml")
     content_map = {}
-    if os.path.exists(map_path):
-        import yaml
+    if HAS_CONTENT_MAP:
         with open(map_path) as f:
-            content_map = yaml.safe_load(f) or {}
+            content_map = yaml.load(f, Loader=YamlLoader) or {}
     return DraftIngester(content_map=content_map)
 
 
@@ -79,11 +90,28 @@ class TestFrontmatterParsing:
         metadata, body = ingester.parse_frontmatter(md)
         assert metadata == {}
 
+    def test_parse_typed_and_list_values(self, ingester, tmp_path):
+        """Inline lists parse as lists; typed scalars keep their YAML types."""
+        md = tmp_path / "typed.md"
+        md.write_text(
+            "---\n"
+            "title: Typed Post\n"
+            "tags: [sales, process]\n"
+            "publish_date: 2025-03-01\n"
+            "featured: true\n"
+            "---\n"
+            "# Typed Post\n"
+        )
+        metadata, _ = ingester.parse_frontmatter(md)
+        assert metadata["tags"] == ["sales", "process"]
+        assert metadata["publish_date"] == date(2025, 3, 1)
+        assert metadata["featured"] is True
+
     @pytest.mark.skipif(not HAS_DRAFTS, reason="04-Blog-Drafts not found")
     def test_parse_real_cluster_page(self, ingester):
         """Parse a real cluster page with full frontmatter."""
         filepath = Path(DRAFTS_DIR) / "Cluster-Pages" / "cluster-process-architecture.md"
-        if not filepath.exists():
+        if filepath.name not in _ls(str(filepath.parent)):
             pytest.skip("cluster-process-architecture.md not found")
         metadata, body = ingester.parse_frontmatter(filepath)
         assert metadata.get("slug") == "sales-process-architecture"
@@ -95,7 +123,7 @@ class TestFrontmatterParsing:
     def test_parse_real_week01_with_frontmatter(self, ingester):
         """Parse a real Week-01 file (now has YAML frontmatter)."""
         filepath = Path(DRAFTS_DIR) / "Week-01" / "day-03-why-92-percent-sales-processes-fail.md"
-        if not filepath.exists():
+        if filepath.name not in _ls(str(filepath.parent)):
             pytest.skip("day-03 file not found")
         metadata, body = ingester.parse_frontmatter(filepath)
         assert metadata.get("slug") == "why-92-percent-sales-processes-fail"
@@ -111,28 +139,28 @@ class TestMetadataInference:
     def test_infer_title_from_h1(self, ingester):
         """H1 in body is extracted as title."""
         body = "# Revenue Growth Framework\n\nContent here."
-        filepath = Path("/tmp/test-post.md")
+        filepath = PurePosixPath("/tmp/test-post.md")
         meta = ingester.infer_metadata_from_content(body, filepath)
         assert meta["title"] == "Revenue Growth Framework"
 
     def test_infer_slug_from_filename(self, ingester):
         """Slug is derived from filename with day-XX- prefix stripped."""
         body = "# Some Title\n\nContent."
-        filepath = Path("/tmp/Week-01/day-05-five-stages-revenue-growth.md")
+        filepath = PurePosixPath("/tmp/Week-01/day-05-five-stages-revenue-growth.md")
         meta = ingester.infer_metadata_from_content(body, filepath)
         assert meta["slug"] == "five-stages-revenue-growth"
 
     def test_infer_pillar_type_from_folder(self, ingester):
         """Pillar-Pages folder sets content_format to pillar_page."""
         body = "# Pillar Title\n\nContent."
-        filepath = Path("/tmp/Pillar-Pages/pillar-strategy.md")
+        filepath = PurePosixPath("/tmp/Pillar-Pages/pillar-strategy.md")
         meta = ingester.infer_metadata_from_content(body, filepath)
         assert meta["content_format"] == "pillar_page"
 
     def test_infer_cluster_type_from_folder(self, ingester):
         """Cluster-Pages folder sets content_format to cluster_page."""
         body = "# Cluster Title\n\nContent."
-        filepath = Path("/tmp/Cluster-Pages/cluster-foo.md")
+        filepath = PurePosixPath("/tmp/Cluster-Pages/cluster-foo.md")
         meta = ingester.infer_metadata_from_content(body, filepath)
         assert meta["content_format"] == "cluster_page"
 
@@ -190,12 +218,43 @@ class TestTopicBuilding:
 # Full draft building (with engine's _parse_draft)
 # ===========================================================================
 
+# Draft whose frontmatter overrides the parsed SEO fields; built once at import
+_FRONTMATTER_OVERRIDES_DRAFT = (
+    b"---\n"
+    b"seo_title: Custom SEO Title | RevHeat\n"
+    b"meta_description: Custom meta description for testing.\n"
+    b"slug: custom-slug\n"
+    b"tags: [tag-one, tag-two]\n"
+    b"category: process\n"
+    b"pillar: process\n"
+    b"focus_keyword: custom keyword\n"
+    b"---\n"
+    b"# Test Draft Title\n\n"
+    b"## Key Takeaway\nThis is a test takeaway.\n\n"
+    b"## TL;DR\n"
+    b"- Bullet one\n"
+    b"- Bullet two\n"
+    b"- Bullet three\n"
+    b"- Bullet four\n\n"
+    b"## Content\nSome test content. " + b"Word " * 200 + b"\n\n"
+    b"## FAQ\n\n"
+    b"**Q: Question one?**\nAnswer one.\n\n"
+    b"**Q: Question two?**\nAnswer two.\n\n"
+    b"**Q: Question three?**\nAnswer three.\n\n"
+    b"**Q: Question four?**\nAnswer four.\n\n"
+    b"**Q: Question five?**\nAnswer five.\n\n"
+    b"| Metric | Before | After |\n"
+    b"|--------|--------|-------|\n"
+    b"| Win Rate | 22% | 41% |\n"
+)
+
+
 class TestDraftBuilding:
     @pytest.mark.skipif(not HAS_DRAFTS, reason="04-Blog-Drafts not found")
     def test_build_draft_from_cluster_page(self, ingester_with_map, engine):
         """Build a full TopicSelection + BlogDraft from a real cluster page."""
         filepath = Path(DRAFTS_DIR) / "Cluster-Pages" / "cluster-process-architecture.md"
-        if not filepath.exists():
+        if filepath.name not in _ls(str(filepath.parent)):
             pytest.skip("cluster-process-architecture.md not found")
 
         topic, draft = ingester_with_map.build_draft_from_file(filepath, engine._parse_draft)
@@ -209,7 +268,7 @@ class TestDraftBuilding:
     def test_build_draft_from_week01_no_frontmatter(self, ingester_with_map, engine):
         """Build a draft from a Week-01 file that has no YAML frontmatter."""
         filepath = Path(DRAFTS_DIR) / "Week-01" / "day-03-why-92-percent-sales-processes-fail.md"
-        if not filepath.exists():
+        if filepath.name not in _ls(str(filepath.parent)):
             pytest.skip("day-03 file not found")
 
         topic, draft = ingester_with_map.build_draft_from_file(filepath, engine._parse_draft)
@@ -217,48 +276,17 @@ class TestDraftBuilding:
         assert draft.title
         assert draft.word_count > 500
 
-    def test_build_draft_frontmatter_overrides(self, ingester, engine):
+    def test_build_draft_frontmatter_overrides(self, ingester, engine, tmp_path):
         """Frontmatter values override _parse_draft defaults."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(
-                "---\n"
-                "seo_title: Custom SEO Title | RevHeat\n"
-                "meta_description: Custom meta description for testing.\n"
-                "slug: custom-slug\n"
-                "tags: [tag-one, tag-two]\n"
-                "category: process\n"
-                "pillar: process\n"
-                "focus_keyword: custom keyword\n"
-                "---\n"
-                "# Test Draft Title\n\n"
-                "## Key Takeaway\nThis is a test takeaway.\n\n"
-                "## TL;DR\n"
-                "- Bullet one\n"
-                "- Bullet two\n"
-                "- Bullet three\n"
-                "- Bullet four\n\n"
-                "## Content\nSome test content. " + "Word " * 200 + "\n\n"
-                "## FAQ\n\n"
-                "**Q: Question one?**\nAnswer one.\n\n"
-                "**Q: Question two?**\nAnswer two.\n\n"
-                "**Q: Question three?**\nAnswer three.\n\n"
-                "**Q: Question four?**\nAnswer four.\n\n"
-                "**Q: Question five?**\nAnswer five.\n\n"
-                "| Metric | Before | After |\n"
-                "|--------|--------|-------|\n"
-                "| Win Rate | 22% | 41% |\n"
-            )
-            tmp_path = f.name
-
-        try:
-            topic, draft = ingester.build_draft_from_file(tmp_path, engine._parse_draft)
-            assert draft.slug == "custom-slug"
-            assert draft.seo_title == "Custom SEO Title | RevHeat"
-            assert draft.meta_description == "Custom meta description for testing."
-            assert "tag-one" in draft.tags
-            assert draft.categories == ["process"]
-        finally:
-            os.unlink(tmp_path)
+        draft_path = tmp_path / "draft.md"
+        draft_path.write_bytes(_FRONTMATTER_OVERRIDES_DRAFT)
+
+        topic, draft = ingester.build_draft_from_file(str(draft_path), engine._parse_draft)
+        assert draft.slug == "custom-slug"
+        assert draft.seo_title == "Custom SEO Title | RevHeat"
+        assert draft.meta_description == "Custom meta description for testing."
+        assert "tag-one" in draft.tags
+        assert draft.categories == ["process"]
 
 
 # ===========================================================================
@@ -293,6 +321,39 @@ class TestFolderScanning:
         folder_names = [f.parent.name for f in result]
         assert folder_names == ["Pillar-Pages", "Cluster-Pages", "Week-01", "Week-02"]
 
+    def test_scan_cache_sees_new_files(self, ingester, tmp_path):
+        """A cached scan is rebuilt once a draft lands in a folder."""
+        (tmp_path / "Week-01").mkdir()
+        (tmp_path / "Week-01" / "day-01.md").write_text("# Day 1")
+        assert len(ingester.scan_drafts_folder(str(tmp_path))) == 1
+
+        (tmp_path / "Week-01" / "day-02.md").write_text("# Day 2")
+        os.utime(tmp_path / "Week-01", ns=(0, 1))  # force an mtime change on coarse filesystems
+        assert len(ingester.scan_drafts_folder(str(tmp_path))) == 2
+
+    def test_scan_cache_sees_nested_changes(self, ingester, tmp_path):
+        """Drafts added or removed below a top-level folder invalidate the cache."""
+        nested = tmp_path / "Week-01" / "extras"
+        nested.mkdir(parents=True)
+        (nested / "day-01.md").write_text("# Day 1")
+        assert len(ingester.scan_drafts_folder(str(tmp_path))) == 1
+
+        (nested / "day-02.md").write_text("# Day 2")
+        os.utime(nested, ns=(0, 1))  # only the nested folder's mtime changes
+        assert len(ingester.scan_drafts_folder(str(tmp_path))) == 2
+
+        (nested / "day-01.md").unlink()
+        os.utime(nested, ns=(0, 2))
+        assert len(ingester.scan_drafts_folder(str(tmp_path))) == 1
+
+    def test_scan_ignores_symlink_loop(self, ingester, tmp_path):
+        """A directory symlink pointing back up the tree is not followed."""
+        (tmp_path / "Week-01").mkdir()
+        (tmp_path / "Week-01" / "a.md").write_text("# A")
+        (tmp_path / "Week-01" / "loop").symlink_to(tmp_path, target_is_directory=True)
+        files = ingester.scan_drafts_folder(str(tmp_path))
+        assert files == [tmp_path / "Week-01" / "a.md"]
+
     @pytest.mark.skipif(not HAS_DRAFTS, reason="04-Blog-Drafts not found")
     def test_scan_real_drafts_folder(self, ingester):
         """Scan actual 04-Blog-Drafts/ directory."""
@@ -331,6 +392,25 @@ class TestIngestionQueue:
         queue = ingester.get_ingestion_queue(str(tmp_path), published)
         assert len(queue) == 0
 
+    @pytest.mark.parametrize("frontmatter,expected", [
+        ("slug: post-alpha\n", "post-alpha"),
+        ("title: Post\nslug: 'post-alpha'\n", "post-alpha"),
+        ("slug: 2024\n", None),
+        ("slug: null\n", None),
+        ("slug: true\n", None),
+        ("slug: post-alpha\nslug: post-beta\n", "post-beta"),
+        ("title: pre---post\nslug: post-alpha\n", None),
+        ("slug: post-alpha\nauthor: {name: Ken}\n", None),
+    ])
+    def test_slug_peek_agrees_with_full_parse(self, ingester, tmp_path, frontmatter, expected):
+        """The head peek returns a slug only when parse_frontmatter yields the same string."""
+        filepath = tmp_path / "post.md"
+        filepath.write_text(f"---\n{frontmatter}---\n# Post\n")
+        assert ingester._peek_frontmatter_slug(filepath) == expected
+        if expected is not None:
+            meta, _ = ingester.parse_frontmatter(filepath)
+            assert meta["slug"] == expected
+
 
 # ===========================================================================
 # Content map matching
@@ -343,7 +423,7 @@ class TestContentMapMatching:
         assert result is None
 
     @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "data", "pillar_cluster_map.yaml")),
+        not HAS_CONTENT_MAP,
         reason="pillar_cluster_map.yaml not found",
     )
     def test_find_real_slug(self, ingester_with_map):
@@ -353,3 +433,17 @@ class TestContentMapMatching:
         # This may or may not match depending on content map structure
         # Just verify no crash
         assert result is None or isinstance(result, dict)
+
+    def test_repeat_lookup_returns_copies(self):
+        """Memoized lookups hand back independent dicts."""
+        content_map = {
+            "process": {
+                "pillar_page": {"slug": "sales-process", "target_keyword": "sales process"},
+            },
+        }
+        ingester = DraftIngester(content_map=content_map)
+        first = ingester._find_in_content_map("sales-process")
+        first["slug"] = "mutated"
+        second = ingester._find_in_content_map("sales_process")
+        assert second["slug"] == "sales-process"
+        assert second["_pillar"] == "process"
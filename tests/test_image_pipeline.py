@@ -1,7 +1,9 @@
 """Tests for the Image Pipeline module."""
 
 import os
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 from dataclasses import dataclass
 
@@ -54,6 +56,23 @@ class TestBarChart:
         assert os.path.exists(result.path)
         assert result.alt_text  # Should have alt text
 
+    def test_matplotlib_setup_runs_once_across_threads(self, pipeline, sample_chart_data):
+        """Concurrent non-bar charts configure matplotlib exactly once."""
+        calls = []
+
+        def slow_setup():
+            calls.append(1)
+            time.sleep(0.05)
+            pipeline._mpl_available = False  # fall back to the Pillow renderer
+
+        with patch.object(pipeline, "_setup_matplotlib", side_effect=slow_setup):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(
+                    lambda i: pipeline.generate_data_chart(sample_chart_data, "line", f"Chart {i}"),
+                    range(4),
+                ))
+        assert len(calls) == 1
+
 
 class TestQuoteCard:
     def test_quote_card_generation(self, pipeline):
@@ -111,6 +130,12 @@ class TestBrandTemplate:
         assert os.path.exists(result_path)
         assert "-branded" in result_path
 
+    def test_brand_config_not_shared(self, pipeline):
+        """Mutating one pipeline's brand config leaves other pipelines untouched."""
+        pipeline.brand["colors"]["primary"] = "#000000"
+        other = ImagePipeline(brand_config_path=BRAND_CONFIG)
+        assert other.brand["colors"]["primary"] != "#000000"
+
 
 class TestCompression:
     def test_compression_fallback(self, pipeline, tmp_path):
@@ -125,8 +150,7 @@ class TestCompression:
         assert result.endswith(".webp")
         assert os.path.exists(result)
 
-    @patch("src.image_pipeline.requests.post")
-    def test_compression_shortpixel(self, mock_post, pipeline, tmp_path):
+    def test_compression_shortpixel(self, pipeline, tmp_path):
         """Compress image via API, verify file size reduction."""
         from PIL import Image
         test_img = Image.new("RGB", (800, 500), (200, 100, 50))
@@ -137,12 +161,43 @@ class TestCompression:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.content = b"\x00" * 100  # Fake compressed content
-        mock_post.return_value = mock_resp
 
         pipeline.shortpixel_key = "test-key"
-        result = pipeline.compress_image(test_path)
+        with patch.object(pipeline._http, "post", return_value=mock_resp) as mock_post:
+            result = pipeline.compress_image(test_path)
+        assert mock_post.called
         assert result.endswith(".webp")
 
+    def test_compress_images_keeps_order(self, pipeline, tmp_path):
+        """Batch compression returns WebP paths in input order."""
+        from PIL import Image
+        paths = []
+        for name in ("first", "second", "third"):
+            path = str(tmp_path / f"{name}.png")
+            Image.new("RGB", (200, 100), (200, 100, 50)).save(path)
+            paths.append(path)
+
+        pipeline.shortpixel_key = ""  # Force fallback
+        results = pipeline.compress_images(paths)
+        assert results == [p.rsplit(".", 1)[0] + ".webp" for p in paths]
+        assert all(os.path.exists(r) for r in results)
+
+    def test_close_closes_http_session(self, pipeline):
+        """close() releases the pooled ShortPixel session."""
+        with patch.object(pipeline._http, "close") as mock_close:
+            pipeline.close()
+        mock_close.assert_called_once()
+
+
+class TestFontCache:
+    def test_fonts_cached_per_thread(self, pipeline):
+        """A thread reuses its own font objects and never gets another thread's."""
+        main_font = pipeline._get_font(24)
+        assert pipeline._get_font(24) is main_font
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            worker_font = pool.submit(pipeline._get_font, 24).result()
+        assert worker_font is not main_font
+
 
 class TestAltText:
     def test_alt_text_generation(self, pipeline):
@@ -157,6 +212,12 @@ class TestAltText:
         assert len(alt) <= 125
         assert "Win Rates" in alt
 
+    def test_alt_text_long_first_word(self, pipeline):
+        """A single overlong word is hard-cut rather than reduced to the placeholder."""
+        alt = pipeline.generate_alt_text({"chart_title": "x" * 200})
+        assert len(alt) == 125
+        assert alt.startswith("x" * 122)
+
 
 class TestWebPConversion:
     def test_webp_conversion(self, pipeline, tmp_path):
@@ -172,6 +233,26 @@ class TestWebPConversion:
         webp_img = Image.open(result)
         assert webp_img.format == "WEBP"
 
+    def test_webp_conversion_reduces_oversized(self, pipeline, tmp_path):
+        """Images at least twice the size cap are shrunk by an integer factor."""
+        from PIL import Image
+        test_path = str(tmp_path / "oversized.png")
+        Image.new("RGB", (800, 600), (100, 150, 200)).save(test_path)
+
+        result = pipeline._compress_pillow(test_path, max_size=(400, 300))
+        assert Image.open(result).size == (400, 300)
+
+    @pytest.mark.parametrize("ext,fmt", [("gif", "GIF"), ("bmp", "BMP"), ("tiff", "TIFF")])
+    def test_webp_conversion_other_formats(self, pipeline, tmp_path, ext, fmt):
+        """GIF/BMP/TIFF inputs are still converted, including the reduce() path."""
+        from PIL import Image
+        test_path = str(tmp_path / f"input.{ext}")
+        Image.new("RGB", (800, 600), (100, 150, 200)).save(test_path, fmt)
+
+        result = pipeline._compress_pillow(test_path, max_size=(400, 300))
+        assert result.endswith(".webp")
+        assert Image.open(result).size == (400, 300)
+
 
 class TestFullPipeline:
     def test_full_pipeline(self, pipeline):
@@ -186,5 +267,7 @@ class TestFullPipeline:
         results = pipeline.full_pipeline(draft)
         assert len(results) >= 1
         assert len(results) <= 3
+        # Concurrent rendering must keep the featured image first
+        assert os.path.basename(results[0].path).startswith("featured-")
         for r in results:
             assert isinstance(r, ImageResult)
@@ -11,6 +11,17 @@ CONFIG_PATH = os.path.join(PROJECT_ROOT, "data", "reddit_config.yaml")
 from src.reddit_monitor import RedditMonitor, RedditThread, ScoredOpportunity
 
 
+def _thread(**overrides):
+    """RedditThread with neutral defaults; pass only the fields a test cares about."""
+    fields = dict(
+        id="1", subreddit="sales", title="", body="", url="",
+        score=5, num_comments=2, created_utc=time.time(), author="test",
+        matched_keywords=[],
+    )
+    fields.update(overrides)
+    return RedditThread(**fields)
+
+
 @pytest.fixture
 def monitor():
     m = RedditMonitor(config_path=CONFIG_PATH)
@@ -80,24 +91,27 @@ class TestOpportunityScoring:
 
     def test_freshness_scoring(self, monitor):
         """Verify fresher threads score higher."""
-        fresh = RedditThread(
-            id="1", subreddit="sales", title="sales process help",
-            body="need help", url="", score=5, num_comments=2,
+        fresh = _thread(
+            title="sales process help", body="need help",
             created_utc=time.time() - 1800,  # 30 min old
-            author="test",
             matched_keywords=["sales process"],
         )
-        old = RedditThread(
-            id="2", subreddit="sales", title="sales process help",
-            body="need help", url="", score=5, num_comments=2,
+        old = _thread(
+            id="2", title="sales process help", body="need help",
             created_utc=time.time() - 82800,  # 23 hours old
-            author="test",
             matched_keywords=["sales process"],
         )
         fresh_score = monitor.score_opportunity(fresh).priority_score
         old_score = monitor.score_opportunity(old).priority_score
         assert fresh_score > old_score
 
+    def test_batch_scoring_matches_single(self, monitor, sample_thread, low_score_thread):
+        """Batch scoring keeps input order and matches per-thread scores."""
+        batch = monitor.score_opportunities_batch([sample_thread, low_score_thread])
+        assert [o.thread.id for o in batch] == ["abc123", "xyz789"]
+        assert batch[0].priority_score == monitor.score_opportunity(sample_thread).priority_score
+        assert batch[1].priority_score == monitor.score_opportunity(low_score_thread).priority_score
+
 
 class TestSMARTSCALINGMapping:
     def test_smartscaling_mapping_process(self, monitor, sample_thread):
@@ -108,12 +122,9 @@ class TestSMARTSCALINGMapping:
 
     def test_smartscaling_mapping_people(self, monitor):
         """Map hiring keywords to People pillar."""
-        thread = RedditThread(
-            id="1", subreddit="sales",
+        thread = _thread(
             title="How do I hire my first salesperson?",
             body="We need to make our first sales hire.",
-            url="", score=5, num_comments=2,
-            created_utc=time.time(), author="test",
             matched_keywords=["sales hire"],
         )
         pillar, function = monitor.map_to_smartscaling(thread)
@@ -122,12 +133,9 @@ class TestSMARTSCALINGMapping:
 
     def test_smartscaling_mapping_compensation(self, monitor):
         """Map compensation keywords to Performance pillar."""
-        thread = RedditThread(
-            id="1", subreddit="sales",
+        thread = _thread(
             title="What's a fair commission structure?",
             body="Trying to set up a good compensation plan.",
-            url="", score=5, num_comments=2,
-            created_utc=time.time(), author="test",
             matched_keywords=["compensation"],
         )
         pillar, function = monitor.map_to_smartscaling(thread)
@@ -135,13 +143,9 @@ class TestSMARTSCALINGMapping:
 
     def test_no_match_returns_empty(self, monitor):
         """Thread with no SMARTSCALING keywords returns empty."""
-        thread = RedditThread(
-            id="1", subreddit="sales",
+        thread = _thread(
             title="What laptop do you use?",
             body="Looking for laptop recommendations for traveling salespeople.",
-            url="", score=5, num_comments=2,
-            created_utc=time.time(), author="test",
-            matched_keywords=[],
         )
         pillar, function = monitor.map_to_smartscaling(thread)
         assert pillar == ""
@@ -161,25 +165,13 @@ class TestResponseDraft:
     @patch("src.reddit_monitor.RedditMonitor._init_anthropic")
     def test_response_type_classification(self, mock_init, monitor):
         """Verify response types are classified correctly."""
-        question_thread = RedditThread(
-            id="1", subreddit="sales", title="How do I improve win rates?",
-            body="", url="", score=5, num_comments=2,
-            created_utc=time.time(), author="test", matched_keywords=[],
-        )
+        question_thread = _thread(title="How do I improve win rates?")
         assert monitor._classify_response_type(question_thread) == "question_answer"
 
-        framework_thread = RedditThread(
-            id="2", subreddit="sales", title="Best sales methodology for services",
-            body="", url="", score=5, num_comments=2,
-            created_utc=time.time(), author="test", matched_keywords=[],
-        )
+        framework_thread = _thread(id="2", title="Best sales methodology for services")
         assert monitor._classify_response_type(framework_thread) == "framework_share"
 
-        data_thread = RedditThread(
-            id="3", subreddit="sales", title="Sales benchmark data for 2026",
-            body="", url="", score=5, num_comments=2,
-            created_utc=time.time(), author="test", matched_keywords=[],
-        )
+        data_thread = _thread(id="3", title="Sales benchmark data for 2026")
         assert monitor._classify_response_type(data_thread) == "data_insight"
 
 
@@ -227,12 +219,9 @@ class TestRSSFallback:
 class TestKeywordMatching:
     def test_primary_keyword_matching(self, monitor):
         """Verify primary keywords match correctly."""
-        thread = RedditThread(
-            id="1", subreddit="sales",
+        thread = _thread(
             title="Building a sales system from scratch",
             body="Need help with B2B sales team structure.",
-            url="", score=5, num_comments=2,
-            created_utc=time.time(), author="test",
             matched_keywords=["sales system", "sales team"],
         )
         opp = monitor.score_opportunity(thread)
@@ -1,5 +1,6 @@
 """Tests for the Schema Builder module."""
 
+import copy
 import json
 import os
 import pytest
@@ -12,38 +13,45 @@ PILLAR_MAP = os.path.join(PROJECT_ROOT, "data", "pillar_cluster_map.yaml")
 from src.schema_builder import SchemaBuilder, ValidationResult
 
 
-@pytest.fixture
+_SAMPLE_POST_DATA = {
+    "post_url": "https://revheat.com/blog/why-92-percent-sales-processes-fail/",
+    "post_title": "Why 92% of Sales Processes Fail",
+    "meta_description": "Data from 33,000 companies reveals why most sales processes break down.",
+    "publish_date_iso": "2026-03-15T09:00:00-05:00",
+    "modified_date_iso": "2026-03-15T09:00:00-05:00",
+    "featured_image_url": "https://revheat.com/wp-content/uploads/sales-process-fail.webp",
+    "word_count": 1650,
+    "smartscaling_pillar": "process",
+    "smartscaling_function": "Sales Process Architecture",
+    "keywords": "sales process failure, sales system, sales optimization",
+    "primary_topic": "Sales Process Optimization",
+    "topic_description": "Why most sales processes fail and the systems approach that works",
+}
+
+_SAMPLE_FAQ_ITEMS = [
+    {"question": "Why do most sales processes fail?", "answer": "Based on data from 33,000 companies, the #1 reason is lack of adherence."},
+    {"question": "How long does it take to fix a broken sales process?", "answer": "Typically 90-180 days for meaningful improvement."},
+    {"question": "What metrics predict sales process health?", "answer": "Conversion rates, cycle time, and win rate are the top three."},
+    {"question": "Should I hire a consultant to fix my sales process?", "answer": "If revenue exceeds $3M and you lack internal expertise, yes."},
+    {"question": "What is the SMARTSCALING framework?", "answer": "A data-backed system covering 11 sales functions across 4 pillars."},
+]
+
+
+@pytest.fixture(scope="session")
 def builder():
+    # Read-only across tests, so load templates and the pillar map once
     return SchemaBuilder(templates_dir=TEMPLATES_DIR, pillar_map_path=PILLAR_MAP)
 
 
 @pytest.fixture
 def sample_post_data():
-    return {
-        "post_url": "https://revheat.com/blog/why-92-percent-sales-processes-fail/",
-        "post_title": "Why 92% of Sales Processes Fail",
-        "meta_description": "Data from 33,000 companies reveals why most sales processes break down.",
-        "publish_date_iso": "2026-03-15T09:00:00-05:00",
-        "modified_date_iso": "2026-03-15T09:00:00-05:00",
-        "featured_image_url": "https://revheat.com/wp-content/uploads/sales-process-fail.webp",
-        "word_count": 1650,
-        "smartscaling_pillar": "process",
-        "smartscaling_function": "Sales Process Architecture",
-        "keywords": "sales process failure, sales system, sales optimization",
-        "primary_topic": "Sales Process Optimization",
-        "topic_description": "Why most sales processes fail and the systems approach that works",
-    }
+    # Some tests add faq_items/howto_steps, so hand out a fresh copy each time
+    return copy.deepcopy(_SAMPLE_POST_DATA)
 
 
 @pytest.fixture
 def sample_faq_items():
-    return [
-        {"question": "Why do most sales processes fail?", "answer": "Based on data from 33,000 companies, the #1 reason is lack of adherence."},
-        {"question": "How long does it take to fix a broken sales process?", "answer": "Typically 90-180 days for meaningful improvement."},
-        {"question": "What metrics predict sales process health?", "answer": "Conversion rates, cycle time, and win rate are the top three."},
-        {"question": "Should I hire a consultant to fix my sales process?", "answer": "If revenue exceeds $3M and you lack internal expertise, yes."},
-        {"question": "What is the SMARTSCALING framework?", "answer": "A data-backed system covering 11 sales functions across 4 pillars."},
-    ]
+    return copy.deepcopy(_SAMPLE_FAQ_ITEMS)
 
 
 class TestArticleSchema:
@@ -192,6 +200,15 @@ class TestValidation:
         result = builder.validate_schema(graph)
         assert result.valid, f"Validation errors: {result.errors}"
 
+    def test_validation_handles_type_array(self, builder, sample_post_data):
+        """An array @type is validated per listed type instead of crashing."""
+        schema = builder.build_article_schema(sample_post_data)
+        schema["@type"] = ["Article", "BlogPosting"]
+        schema["headline"] = ""
+        result = builder.validate_schema({"@graph": [schema]})
+        assert not result.valid
+        assert any("headline" in e.lower() for e in result.errors)
+
 
 class TestInjectHTML:
     def test_inject_into_html(self, builder, sample_post_data):
@@ -214,6 +231,19 @@ class TestInjectHTML:
         result = builder.inject_into_html(html, schema)
         assert '<script type="application/ld+json">' in result
 
+    def test_inject_stringifies_non_str_keys(self, builder):
+        """Non-string keys are written as strings, as json.dumps would."""
+        result = builder.inject_into_html("<p>x</p>", {"@type": "Thing", 1: "one"})
+        payload = result[result.index('json">') + len('json">'):result.index("</script>")]
+        assert json.loads(payload) == {"@type": "Thing", "1": "one"}
+
+    def test_inject_only_once(self, builder):
+        """An embedded </body> gets no copy; the script lands before the real one."""
+        html = "<body><iframe srcdoc='<body></body>'></iframe></body>"
+        result = builder.inject_into_html(html, {"@type": "Article"})
+        assert result.count("application/ld+json") == 1
+        assert result.endswith("</script>\n</body>")
+
     def test_json_ld_is_valid_json(self, builder, sample_post_data):
         """Verify injected JSON-LD is valid parseable JSON."""
         html = "<html><body><p>Test</p></body></html>"
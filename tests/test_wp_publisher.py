@@ -1,73 +1,96 @@
 """Tests for the WordPress Publisher module using mocked HTTP responses."""
 
+import io
 import json
+import re
+import time
+
+import numpy as np
 import pytest
 import responses
+from responses.registries import OrderedRegistry
 from unittest.mock import patch
 
 from src.wp_publisher import WordPressPublisher, AuthenticationError
+from tests._wp_helpers import _register_stubs
 
 
 BASE_URL = "https://test.revheat.com"
 API_BASE = f"{BASE_URL}/wp-json/wp/v2"
 
+# Query-string stubs, compiled once instead of re-parsed per registration
+_EXISTING_POST_RE = re.compile(rf"{re.escape(API_BASE)}/posts\?slug=existing-post&status=publish$")
+_DRAFT_QUEUE_RE = re.compile(rf"{re.escape(API_BASE)}/posts\?status=draft&per_page=20&orderby=date$")
+
+
+def _encode_test_png():
+    """Encode a noisy 200x200 PNG, large enough to pass the 1KB upload check."""
+    from PIL import Image as PILImage
+
+    pixels = np.random.default_rng(0).integers(0, 256, size=(200, 200, 3), dtype=np.uint8)
+    buf = io.BytesIO()
+    PILImage.fromarray(pixels, "RGB").save(buf, "PNG")
+    return buf.getvalue()
+
+
+_TEST_PNG_BYTES = _encode_test_png()
+
+
+@pytest.fixture
+def body_for():
+    """Return a lookup for the JSON body of the first request whose URL ends with a path."""
+    parsed = {}
+
+    def _body_for(path_suffix):
+        for i, call in enumerate(responses.calls):
+            if call.request.url.endswith(path_suffix):
+                if i not in parsed:
+                    parsed[i] = json.loads(call.request.body)
+                return parsed[i]
+        raise AssertionError(f"No request sent to ...{path_suffix}")
 
-@responses.activate
-def _make_publisher():
-    """Helper: create a publisher with mocked connection verification."""
-    responses.add(
-        responses.GET,
-        f"{API_BASE}/",
-        json={"name": "RevHeat", "namespaces": ["wp/v2"]},
-        status=200,
-    )
-    return WordPressPublisher(
-        base_url=BASE_URL,
-        username="testuser",
-        app_password="test-pass",
-    )
+    return _body_for
 
 
 class TestConnection:
     @responses.activate
     def test_connection_success(self):
         """Verify WP REST API is reachable and authenticated."""
-        responses.add(
-            responses.GET, f"{API_BASE}/",
-            json={"name": "RevHeat"}, status=200,
-        )
+        _register_stubs(API_BASE)
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         assert wp.base_url == BASE_URL
 
     @responses.activate
     def test_connection_failure(self):
         """Verify ConnectionError raised when WP is unreachable."""
-        responses.add(
-            responses.GET, f"{API_BASE}/",
-            json={"error": "not found"}, status=500,
-        )
+        _register_stubs(API_BASE, [
+            (responses.GET, "/", {"error": "not found"}, 500),
+        ], verify=False)
         # After retries it should raise
         with pytest.raises(Exception):
             WordPressPublisher(BASE_URL, "testuser", "test-pass")
 
+    @responses.activate
+    def test_context_manager_closes_session(self):
+        """Leaving the with-block closes the pooled session."""
+        _register_stubs(API_BASE)
+        wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
+        with patch.object(wp._session, "close") as mock_close:
+            with wp:
+                pass
+        mock_close.assert_called_once()
+
 
 class TestCreateDraft:
-    @responses.activate
+    @responses.activate(registry=OrderedRegistry)
     def test_create_and_delete_draft(self):
         """Create a test draft, verify it exists, then delete it."""
-        # Connection verify
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        # Create draft
-        responses.add(
-            responses.POST, f"{API_BASE}/posts",
-            json={"id": 42, "title": {"rendered": "Test Post"}, "status": "draft", "link": f"{BASE_URL}/?p=42"},
-            status=201,
-        )
-        # Delete
-        responses.add(
-            responses.DELETE, f"{API_BASE}/posts/42?force=true",
-            json={"id": 42, "deleted": True}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            # Create draft
+            (responses.POST, "/posts", {"id": 42, "title": {"rendered": "Test Post"}, "status": "draft", "link": f"{BASE_URL}/?p=42"}, 201),
+            # Delete
+            (responses.DELETE, "/posts/42?force=true", {"id": 42, "deleted": True}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         post = wp.create_draft("Test Post", "<p>Test content</p>")
@@ -78,14 +101,11 @@ class TestCreateDraft:
         assert result is True
 
     @responses.activate
-    def test_create_draft_with_meta(self):
+    def test_create_draft_with_meta(self, body_for):
         """Create draft with SEO meta fields."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts",
-            json={"id": 43, "title": {"rendered": "SEO Post"}, "status": "draft", "link": f"{BASE_URL}/?p=43"},
-            status=201,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts", {"id": 43, "title": {"rendered": "SEO Post"}, "status": "draft", "link": f"{BASE_URL}/?p=43"}, 201),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         meta = {
@@ -97,7 +117,7 @@ class TestCreateDraft:
         assert post["id"] == 43
 
         # Verify meta was sent in the request body
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts")
         assert request_body["meta"]["rank_math_title"] == "SEO Title | RevHeat"
 
 
@@ -105,33 +125,17 @@ class TestUploadImage:
     @responses.activate
     def test_upload_image(self, tmp_path):
         """Upload a test image, verify media ID returned, then delete."""
-        # Connection verify
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        # Upload
-        responses.add(
-            responses.POST, f"{API_BASE}/media",
-            json={"id": 101, "source_url": f"{BASE_URL}/wp-content/uploads/test.png"},
-            status=201,
-        )
-        # Set alt text
-        responses.add(
-            responses.POST, f"{API_BASE}/media/101",
-            json={"id": 101, "alt_text": "Test image"}, status=200,
-        )
-        # Delete
-        responses.add(
-            responses.DELETE, f"{API_BASE}/media/101?force=true",
-            json={"id": 101, "deleted": True}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            # Upload
+            (responses.POST, "/media", {"id": 101, "source_url": f"{BASE_URL}/wp-content/uploads/test.png"}, 201),
+            # Set alt text
+            (responses.POST, "/media/101", {"id": 101, "alt_text": "Test image"}, 200),
+            # Delete
+            (responses.DELETE, "/media/101?force=true", {"id": 101, "deleted": True}, 200),
+        ])
 
-        # Create a test image large enough to pass the 1KB minimum check
         test_image = tmp_path / "test.png"
-        import random
-        from PIL import Image as PILImage
-        pil_img = PILImage.new("RGB", (200, 200))
-        pixels = [(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)) for _ in range(200*200)]
-        pil_img.putdata(pixels)
-        pil_img.save(str(test_image), "PNG")
+        test_image.write_bytes(_TEST_PNG_BYTES)
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         media_id = wp.upload_image(str(test_image), "Test image alt text")
@@ -140,20 +144,55 @@ class TestUploadImage:
         result = wp.delete_media(101)
         assert result is True
 
+    @responses.activate
+    def test_upload_images_keeps_input_order(self, tmp_path):
+        """Concurrent uploads return IDs in input order, each with its own upload headers."""
+        media_ids = {"first.png": 101, "second.webp": 102, "third.png": 103}
+
+        def upload(request):
+            filename = re.search(r'filename="([^"]+)"', request.headers["Content-Disposition"]).group(1)
+            if filename == "first.png":
+                time.sleep(0.2)  # finish after the others
+            return 201, {}, json.dumps({"id": media_ids[filename]})
+
+        _register_stubs(API_BASE, [
+            (responses.POST, re.compile(rf"{re.escape(API_BASE)}/media/\d+$"), {"id": 0}, 200),
+        ])
+        responses.add_callback(responses.POST, f"{API_BASE}/media", callback=upload)
+
+        paths = []
+        for name in media_ids:
+            path = tmp_path / name
+            path.write_bytes(_TEST_PNG_BYTES)
+            paths.append((str(path), f"Alt for {name}"))
+
+        wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
+        assert wp.upload_images(paths) == [101, 102, 103]
+
+        uploads = [c.request for c in responses.calls if c.request.url == f"{API_BASE}/media"]
+        assert len(uploads) == 3
+        sent = {r.headers["Content-Disposition"]: r.headers["Content-Type"] for r in uploads}
+        assert sent == {
+            'attachment; filename="first.png"': "image/png",
+            'attachment; filename="second.webp"': "image/webp",
+            'attachment; filename="third.png"': "image/png",
+        }
+        assert all(r.headers["Authorization"] == wp.headers["Authorization"] for r in uploads)
+        # The per-call upload headers don't leak into the shared defaults
+        alt_updates = [c.request for c in responses.calls if re.search(r"/media/\d+$", c.request.url)]
+        assert len(alt_updates) == 3
+        assert all(r.headers["Content-Type"] == "application/json" for r in alt_updates)
+        assert "Content-Disposition" not in wp.headers
+
 
 class TestFeaturedImage:
     @responses.activate
     def test_set_featured_image(self):
         """Create draft, set featured image, verify."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts",
-            json={"id": 44, "status": "draft"}, status=201,
-        )
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44, "featured_media": 101}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts", {"id": 44, "status": "draft"}, 201),
+            (responses.POST, "/posts/44", {"id": 44, "featured_media": 101}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         post = wp.create_draft("Featured Test", "<p>Content</p>")
@@ -165,12 +204,9 @@ class TestTaxonomy:
     @responses.activate
     def test_category_lookup(self):
         """Look up category by slug, verify correct ID."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.GET, f"{API_BASE}/categories?slug=sales-process",
-            json=[{"id": 12, "slug": "sales-process", "name": "Sales Process"}],
-            status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.GET, "/categories?slug=sales-process", [{"id": 12, "slug": "sales-process", "name": "Sales Process"}], 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         cat_id = wp.get_category_id("sales-process")
@@ -185,18 +221,12 @@ class TestTaxonomy:
     @responses.activate
     def test_tag_creation(self):
         """Create a new tag via API, verify it exists."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        # Tag doesn't exist yet
-        responses.add(
-            responses.GET, f"{API_BASE}/tags?slug=new-tag",
-            json=[], status=200,
-        )
-        # Create it
-        responses.add(
-            responses.POST, f"{API_BASE}/tags",
-            json={"id": 99, "slug": "new-tag", "name": "new-tag"},
-            status=201,
-        )
+        _register_stubs(API_BASE, [
+            # Tag doesn't exist yet
+            (responses.GET, "/tags?slug=new-tag", [], 200),
+            # Create it
+            (responses.POST, "/tags", {"id": 99, "slug": "new-tag", "name": "new-tag"}, 201),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         tag_id = wp.get_tag_id("new-tag")
@@ -205,13 +235,11 @@ class TestTaxonomy:
 
 class TestSEOMeta:
     @responses.activate
-    def test_seo_meta(self):
+    def test_seo_meta(self, body_for):
         """Set Rank Math meta fields, verify request payload."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.set_seo_meta(
@@ -222,20 +250,18 @@ class TestSEOMeta:
         )
         assert result is True
 
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts/44")
         assert request_body["meta"]["rank_math_title"] == "SEO Title | RevHeat"
         assert request_body["meta"]["rank_math_focus_keyword"] == "primary keyword"
 
 
 class TestScheduling:
     @responses.activate
-    def test_schedule_post(self):
+    def test_schedule_post(self, body_for):
         """Schedule a post for future, verify status=future in request."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44, "status": "future"}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44, "status": "future"}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         from datetime import datetime
@@ -243,47 +269,28 @@ class TestScheduling:
         result = wp.schedule_post(44, future_date)
         assert result is True
 
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts/44")
         assert request_body["status"] == "future"
 
 
 class TestFullPipeline:
-    @responses.activate
+    @responses.activate(registry=OrderedRegistry)
     def test_full_pipeline(self, tmp_path):
         """End-to-end: create draft -> set SEO meta -> assign categories -> schedule -> verify."""
-        # Connection
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        # Create draft
-        responses.add(
-            responses.POST, f"{API_BASE}/posts",
-            json={"id": 50, "title": {"rendered": "Pipeline Test"}, "status": "draft", "link": f"{BASE_URL}/?p=50"},
-            status=201,
-        )
-        # Set SEO meta
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/50",
-            json={"id": 50}, status=200,
-        )
-        # Category lookup
-        responses.add(
-            responses.GET, f"{API_BASE}/categories?slug=process",
-            json=[{"id": 5, "slug": "process"}], status=200,
-        )
-        # Assign taxonomy
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/50",
-            json={"id": 50}, status=200,
-        )
-        # Schedule
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/50",
-            json={"id": 50, "status": "future"}, status=200,
-        )
-        # Delete cleanup
-        responses.add(
-            responses.DELETE, f"{API_BASE}/posts/50?force=true",
-            json={"id": 50, "deleted": True}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            # Create draft
+            (responses.POST, "/posts", {"id": 50, "title": {"rendered": "Pipeline Test"}, "status": "draft", "link": f"{BASE_URL}/?p=50"}, 201),
+            # Set SEO meta
+            (responses.POST, "/posts/50", {"id": 50}, 200),
+            # Category lookup
+            (responses.GET, "/categories?slug=process", [{"id": 5, "slug": "process"}], 200),
+            # Assign taxonomy
+            (responses.POST, "/posts/50", {"id": 50}, 200),
+            # Schedule
+            (responses.POST, "/posts/50", {"id": 50, "status": "future"}, 200),
+            # Delete cleanup
+            (responses.DELETE, "/posts/50?force=true", {"id": 50, "deleted": True}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
 
@@ -306,21 +313,79 @@ class TestFullPipeline:
         # Cleanup
         assert wp.delete_post(50)
 
+    @responses.activate
+    def test_batch_pipeline(self, body_for):
+        """SEO meta, categories and schedule go out as one post update."""
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts", {"id": 50, "status": "draft"}, 201),
+            (responses.GET, "/categories?slug=process", [{"id": 5, "slug": "process"}], 200),
+            (responses.POST, "/posts/50", {"id": 50, "status": "future"}, 200),
+        ])
+
+        wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
+        post = wp.create_draft("Pipeline Test", "<p>Full pipeline content</p>")
+        cat_id = wp.get_category_id("process")
+
+        from datetime import datetime
+        assert wp.batch_update(
+            post["id"],
+            meta={"rank_math_title": "SEO Title"},
+            categories=[cat_id, 0],
+            date=datetime(2026, 6, 15, 9, 0),
+            status="future",
+        )
+
+        # verify + create + lookup + a single update
+        assert len(responses.calls) == 4
+        request_body = body_for("/posts/50")
+        assert request_body == {
+            "meta": {"rank_math_title": "SEO Title"},
+            "categories": [5],
+            "date": "2026-06-15T09:00:00",
+            "status": "future",
+        }
+
+    @responses.activate
+    def test_batch_update_merges_rank_math_meta(self, body_for):
+        """SEO, social and canonical meta plus the featured image share one request."""
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/50", {"id": 50}, 200),
+        ])
+
+        wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
+        assert wp.batch_update(
+            50,
+            featured_media=7,
+            tags=[3],
+            seo={"seo_title": "SEO Title", "meta_desc": "Desc", "focus_keyword": "kw",
+                 "secondary_keywords": ["a", "b"]},
+            social={"title": "OG Title", "description": "Desc", "image_url": "https://x/img.webp"},
+            canonical_url="https://revheat.com/post/",
+        )
+
+        # verify + a single update
+        assert len(responses.calls) == 2
+        body = body_for("/posts/50")
+        assert body["featured_media"] == 7
+        assert body["tags"] == [3]
+        meta = body["meta"]
+        assert meta["rank_math_focus_keyword"] == "kw,a,b"
+        assert meta["rank_math_robots"] == "index,follow"
+        assert meta["rank_math_facebook_image"] == "https://x/img.webp"
+        assert meta["rank_math_twitter_creator"] == "@RevHeat"
+        assert meta["rank_math_canonical_url"] == "https://revheat.com/post/"
+
 
 class TestDraftQueue:
     @responses.activate
     def test_get_draft_queue(self):
         """Verify draft queue returns correct structure."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.GET,
-            f"{API_BASE}/posts?status=draft&per_page=20&orderby=date",
-            json=[
+        _register_stubs(API_BASE, [
+            (responses.GET, _DRAFT_QUEUE_RE, [
                 {"id": 1, "title": {"rendered": "Draft 1"}, "date": "2026-03-01", "link": f"{BASE_URL}/?p=1"},
                 {"id": 2, "title": {"rendered": "Draft 2"}, "date": "2026-03-02", "link": f"{BASE_URL}/?p=2"},
-            ],
-            status=200,
-        )
+            ], 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         drafts = wp.get_draft_queue()
@@ -331,13 +396,11 @@ class TestDraftQueue:
 
 class TestSocialMeta:
     @responses.activate
-    def test_set_social_meta(self):
+    def test_set_social_meta(self, body_for):
         """Set OpenGraph + Twitter Card meta, verify request payload."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.set_social_meta(
@@ -349,7 +412,7 @@ class TestSocialMeta:
         )
         assert result is True
 
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts/44")
         meta = request_body["meta"]
         assert meta["rank_math_facebook_title"] == "OG Title | RevHeat"
         assert meta["rank_math_facebook_description"] == "Social description for sharing"
@@ -359,19 +422,17 @@ class TestSocialMeta:
         assert meta["rank_math_twitter_image"] == "https://revheat.com/wp-content/uploads/featured.jpg"
 
     @responses.activate
-    def test_set_social_meta_no_image(self):
+    def test_set_social_meta_no_image(self, body_for):
         """Social meta without image omits image fields."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.set_social_meta(44, title="Title", description="Desc")
         assert result is True
 
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts/44")
         meta = request_body["meta"]
         assert "rank_math_facebook_image" not in meta
         assert "rank_math_twitter_image" not in meta
@@ -379,31 +440,27 @@ class TestSocialMeta:
 
 class TestCanonicalUrl:
     @responses.activate
-    def test_set_canonical_url(self):
+    def test_set_canonical_url(self, body_for):
         """Set canonical URL via Rank Math field."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.set_canonical_url(44, "https://revheat.com/blog/my-post/")
         assert result is True
 
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts/44")
         assert request_body["meta"]["rank_math_canonical_url"] == "https://revheat.com/blog/my-post/"
 
 
 class TestSEOMetaSecondaryKeywords:
     @responses.activate
-    def test_seo_meta_with_secondary_keywords(self):
+    def test_seo_meta_with_secondary_keywords(self, body_for):
         """Set SEO meta with secondary keywords joined into focus keyword field."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.set_seo_meta(
@@ -415,20 +472,18 @@ class TestSEOMetaSecondaryKeywords:
         )
         assert result is True
 
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts/44")
         focus_kw = request_body["meta"]["rank_math_focus_keyword"]
         assert "primary keyword" in focus_kw
         assert "secondary one" in focus_kw
         assert "secondary two" in focus_kw
 
     @responses.activate
-    def test_seo_meta_with_robots(self):
+    def test_seo_meta_with_robots(self, body_for):
         """Set SEO meta with custom robots directive."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44}, status=200,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44}, 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.set_seo_meta(
@@ -437,7 +492,7 @@ class TestSEOMetaSecondaryKeywords:
         )
         assert result is True
 
-        request_body = json.loads(responses.calls[1].request.body)
+        request_body = body_for("/posts/44")
         assert request_body["meta"]["rank_math_robots"] == "noindex,nofollow"
 
 
@@ -445,11 +500,9 @@ class TestStatusCodeHandling:
     @responses.activate
     def test_201_treated_as_success(self):
         """HTTP 201 is treated as success (not just 200)."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44, "featured_media": 101}, status=201,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44, "featured_media": 101}, 201),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.set_featured_image(44, 101)
@@ -458,11 +511,9 @@ class TestStatusCodeHandling:
     @responses.activate
     def test_assign_taxonomy_201(self):
         """Assign taxonomy returns True on 201."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        responses.add(
-            responses.POST, f"{API_BASE}/posts/44",
-            json={"id": 44}, status=201,
-        )
+        _register_stubs(API_BASE, [
+            (responses.POST, "/posts/44", {"id": 44}, 201),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         result = wp.assign_taxonomy(44, [5], [10])
@@ -473,13 +524,10 @@ class TestDuplicateProtection:
     @responses.activate
     def test_create_draft_skips_existing(self):
         """Create draft returns existing post when slug already exists."""
-        responses.add(responses.GET, f"{API_BASE}/", json={"name": "RevHeat"}, status=200)
-        # Post exists check - return existing
-        responses.add(
-            responses.GET, f"{API_BASE}/posts?slug=existing-post&status=publish",
-            json=[{"id": 99, "title": {"rendered": "Existing"}, "status": "publish"}],
-            status=200,
-        )
+        _register_stubs(API_BASE, [
+            # Post exists check - return existing
+            (responses.GET, _EXISTING_POST_RE, [{"id": 99, "title": {"rendered": "Existing"}, "status": "publish"}], 200),
+        ])
 
         wp = WordPressPublisher(BASE_URL, "testuser", "test-pass")
         post = wp.create_draft("Existing", "<p>Content</p>", slug="existing-post")
@@ -490,9 +538,8 @@ class TestErrorHandling:
     @responses.activate
     def test_authentication_error(self):
         """Verify AuthenticationError raised on 401."""
-        responses.add(
-            responses.GET, f"{API_BASE}/",
-            json={"code": "rest_cannot_access"}, status=401,
-        )
+        _register_stubs(API_BASE, [
+            (responses.GET, "/", {"code": "rest_cannot_access"}, 401),
+        ], verify=False)
         with pytest.raises(AuthenticationError):
             WordPressPublisher(BASE_URL, "testuser", "bad-pass")